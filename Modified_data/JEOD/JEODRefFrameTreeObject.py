@@ -17,10 +17,24 @@ import trick
 from ..SpaceFOM.SpaceFOMFederateConfig import *
 from ..SpaceFOM.SpaceFOMRefFrameObject import *
 
+# Reference Frame tree frame descriptors in discovery order:
+#    (FOM instance name, tree frame shortcut, frame sim object name,
+#     parent frame sim object name, parent FOM instance name, is root frame)
+_FRAME_SPECS = (
+   ( 'SolarSystemBarycentricInertial', 'ssbary_frame',     'solar_system_barycenter', None,                      None,                             True ),
+   ( 'SunCentricInertial',             'sun_frame',        'sun_inertial',            'solar_system_barycenter', 'SolarSystemBarycentricInertial', False ),
+   ( 'EarthMoonBarycentricInertial',   'embary_frame',     'earth_moon_barycenter',   'solar_system_barycenter', 'SolarSystemBarycentricInertial', False ),
+   ( 'EarthMJ2000Eq',                  'earth_frame',      'earth_centered_inertial', 'earth_moon_barycenter',   'EarthMoonBarycentricInertial',   False ),
+   ( 'MoonCentricInertial',            'moon_frame',       'moon_centered_inertial',  'earth_moon_barycenter',   'EarthMoonBarycentricInertial',   False ),
+   ( 'MarsCentricInertial',            'mars_frame',       'mars_centered_inertial',  'solar_system_barycenter', 'SolarSystemBarycentricInertial', False ),
+   ( 'EarthCentricFixed',              'earth_pfix_frame', 'earth_centered_fixed',    'earth_centered_inertial', 'EarthMJ2000Eq',                  False ),
+   ( 'MoonCentricFixed',               'moon_pfix_frame',  'moon_centered_fixed',     'moon_centered_inertial',  'MoonCentricInertial',            False ),
+   ( 'MarsCentricFixed',               'mars_pfix_frame',  'mars_centered_fixed',     'mars_centered_inertial',  'MarsCentricInertial',            False ) )
+
 
 #class JEODRefFrameTreeObject(TrickHLAObjectConfig):
 class JEODRefFrameTreeObject():
-   
+
    federate = None
 
    # Persistent access to tree frames.
@@ -38,144 +52,66 @@ class JEODRefFrameTreeObject():
                  federate_instance,
                  tree_instance,
                  create_frame_objects = False,
-                 lag_comp_type = trick.TrickHLA.LAG_COMPENSATION_NONE ):
+                 lag_comp_type = THLA_LAG_NONE ):
       
       # Refernce the federate object.
-      federate = federate_instance
+      self.federate = federate_instance
 
       # Setup shortcuts to planetary reference frame objects.
-      ssbary_frame     = tree_instance.ssbary_frame_ptr
-      sun_frame        = tree_instance.sun_frame_ptr
-      embary_frame     = tree_instance.embary_frame_ptr
-      earth_frame      = tree_instance.earth_frame_ptr
-      moon_frame       = tree_instance.moon_frame_ptr
-      mars_frame       = tree_instance.mars_frame_ptr
-      earth_pfix_frame = tree_instance.earth_pfix_frame_ptr
-      moon_pfix_frame  = tree_instance.moon_pfix_frame_ptr
-      mars_pfix_frame  = tree_instance.mars_pfix_frame_ptr
+      self.ssbary_frame     = tree_instance.ssbary_frame_ptr
+      self.sun_frame        = tree_instance.sun_frame_ptr
+      self.embary_frame     = tree_instance.embary_frame_ptr
+      self.earth_frame      = tree_instance.earth_frame_ptr
+      self.moon_frame       = tree_instance.moon_frame_ptr
+      self.mars_frame       = tree_instance.mars_frame_ptr
+      self.earth_pfix_frame = tree_instance.earth_pfix_frame_ptr
+      self.moon_pfix_frame  = tree_instance.moon_pfix_frame_ptr
+      self.mars_pfix_frame  = tree_instance.mars_pfix_frame_ptr
 
       #---------------------------------------------------------------------------
       # Set up the Reference Frame tree RefFrame objects for discovery.
       #---------------------------------------------------------------------------
-      # Setup the solar system barycenter frame.
-      # This will be the root reference frame for the tree.
-      ssbary_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                                 'SolarSystemBarycentricInertial',
-                                                 ssbary_frame,
-                                                 'solar_system_barycenter.frame_packing' )
-      # Set the root frame and add it to the federate.
-      federate.set_root_frame( ssbary_frame_obj )
-
-      # Setup the Sun inertial frame.
-      sun_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                              'SunCentricInertial',
-                                              sun_frame,
-                                              'sun_inertial.frame_packing',
-                                              solar_system_barycenter.frame_packing,
-                                              'SolarSystemBarycentricInertial',
-                                              frame_conditional   = sun_inertial.conditional,
-                                              frame_lag_comp      = sun_inertial.lag_compensation,
-                                              frame_lag_comp_type = lag_comp_type,
-                                              frame_ownership     = sun_inertial.ownership_handler,
-                                              frame_deleted       = sun_inertial.deleted_callback )
-      federate.add_fed_object( sun_frame_obj )
-
-      # Setup the Earth-Moon barycenter inertial frame.
-      embary_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                                 'EarthMoonBarycentricInertial',
-                                                 embary_frame,
-                                                 'earth_moon_barycenter.frame_packing',
-                                                 solar_system_barycenter.frame_packing,
-                                                 'SolarSystemBarycentricInertial',
-                                                 frame_conditional   = earth_moon_barycenter.conditional,
-                                                 frame_lag_comp      = earth_moon_barycenter.lag_compensation,
-                                                 frame_lag_comp_type = lag_comp_type,
-                                                 frame_ownership     = earth_moon_barycenter.ownership_handler,
-                                                 frame_deleted       = earth_moon_barycenter.deleted_callback )
-      federate.add_fed_object( embary_frame_obj )
-
-      # Setup the Earth inertial frame.
-      earth_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                                'EarthMJ2000Eq',
-                                                earth_frame,
-                                                'earth_centered_inertial.frame_packing',
-                                                earth_moon_barycenter.frame_packing,
-                                                'EarthMoonBarycentricInertial',
-                                                frame_conditional   = earth_centered_inertial.conditional,
-                                                frame_lag_comp      = earth_centered_inertial.lag_compensation,
+      # The frame sim objects are pulled in from trick.top at module scope.
+      sim_objects = globals()
+
+      for ( frame_FOM_name,
+            tree_frame_name,
+            frame_sim_obj_name,
+            parent_sim_obj_name,
+            parent_FOM_name,
+            is_root ) in _FRAME_SPECS :
+
+         frame_packing_name = frame_sim_obj_name + '.frame_packing'
+         tree_frame         = getattr( self, tree_frame_name )
+
+         if is_root :
+            # The solar system barycenter frame is the root reference frame
+            # for the tree.
+            frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
+                                                frame_FOM_name,
+                                                tree_frame,
+                                                frame_packing_name )
+
+            # Set the root frame and add it to the federate.
+            self.federate.set_root_frame( frame_obj )
+
+         else:
+            frame_sim_obj  = sim_objects[frame_sim_obj_name]
+            parent_sim_obj = sim_objects[parent_sim_obj_name]
+
+            frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
+                                                frame_FOM_name,
+                                                tree_frame,
+                                                frame_packing_name,
+                                                parent_sim_obj.frame_packing,
+                                                parent_FOM_name,
+                                                frame_conditional   = frame_sim_obj.conditional,
+                                                frame_lag_comp      = frame_sim_obj.lag_compensation,
                                                 frame_lag_comp_type = lag_comp_type,
-                                                frame_ownership     = earth_centered_inertial.ownership_handler,
-                                                frame_deleted       = earth_centered_inertial.deleted_callback )
-      federate.add_fed_object( earth_frame_obj )
-
-      # Setup the Moon inertial frame.
-      moon_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                               'MoonCentricInertial',
-                                               moon_frame,
-                                               'moon_centered_inertial.frame_packing',
-                                               earth_moon_barycenter.frame_packing,
-                                               'EarthMoonBarycentricInertial',
-                                               frame_conditional   = moon_centered_inertial.conditional,
-                                               frame_lag_comp      = moon_centered_inertial.lag_compensation,
-                                               frame_lag_comp_type = lag_comp_type,
-                                               frame_ownership     = moon_centered_inertial.ownership_handler,
-                                               frame_deleted       = moon_centered_inertial.deleted_callback )
-      # Add the frame to federate.
-      federate.add_fed_object( moon_frame_obj )
-
-      mars_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                               'MarsCentricInertial',
-                                               mars_frame,
-                                               'mars_centered_inertial.frame_packing',
-                                               solar_system_barycenter.frame_packing,
-                                               'SolarSystemBarycentricInertial',
-                                               frame_conditional   = mars_centered_inertial.conditional,
-                                               frame_lag_comp      = mars_centered_inertial.lag_compensation,
-                                               frame_lag_comp_type = lag_comp_type,
-                                               frame_ownership     = mars_centered_inertial.ownership_handler,
-                                               frame_deleted       = mars_centered_inertial.deleted_callback )
-      federate.add_fed_object( mars_frame_obj )
-
-      # Setup the Earth planet fixed frame.
-      earth_pfix_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                                     'EarthCentricFixed',
-                                                     earth_pfix_frame,
-                                                     'earth_centered_fixed.frame_packing',
-                                                     earth_centered_inertial.frame_packing,
-                                                     'EarthMJ2000Eq',
-                                                     frame_conditional   = earth_centered_fixed.conditional,
-                                                     frame_lag_comp      = earth_centered_fixed.lag_compensation,
-                                                     frame_lag_comp_type = lag_comp_type,
-                                                     frame_ownership     = earth_centered_fixed.ownership_handler,
-                                                     frame_deleted       = earth_centered_fixed.deleted_callback )
-      federate.add_fed_object( earth_pfix_frame_obj )
-
-      # Setup the Moon planet fixed frame.
-      moon_pfix_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                                    'MoonCentricFixed',
-                                                    moon_pfix_frame,
-                                                    'moon_centered_fixed.frame_packing',
-                                                    moon_centered_inertial.frame_packing,
-                                                    'MoonCentricInertial',
-                                                    frame_conditional   = moon_centered_fixed.conditional,
-                                                    frame_lag_comp      = moon_centered_fixed.lag_compensation,
-                                                    frame_lag_comp_type = lag_comp_type,
-                                                    frame_ownership     = moon_centered_fixed.ownership_handler,
-                                                    frame_deleted       = moon_centered_fixed.deleted_callback )
-      federate.add_fed_object( moon_pfix_frame_obj )
-
-      # Setup the Mars planet fixed frame.
-      mars_pfix_frame_obj = SpaceFOMRefFrameObject( create_frame_objects,
-                                                    'MarsCentricFixed',
-                                                    mars_pfix_frame,
-                                                    'mars_centered_fixed.frame_packing',
-                                                    mars_centered_inertial.frame_packing,
-                                                    'MarsCentricInertial',
-                                                    frame_conditional   = mars_centered_fixed.conditional,
-                                                    frame_lag_comp      = mars_centered_fixed.lag_compensation,
-                                                    frame_lag_comp_type = lag_comp_type,
-                                                    frame_ownership     = mars_centered_fixed.ownership_handler,
-                                                    frame_deleted       = mars_centered_fixed.deleted_callback )
-      federate.add_fed_object( mars_pfix_frame_obj )
+                                                frame_ownership     = frame_sim_obj.ownership_handler,
+                                                frame_deleted       = frame_sim_obj.deleted_callback )
+
+            # Add the frame to federate.
+            self.federate.add_fed_object( frame_obj )
 
       return
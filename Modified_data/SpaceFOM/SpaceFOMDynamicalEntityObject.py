@@ -21,6 +21,16 @@ from ..SpaceFOM.SpaceFOMPhysicalEntityObject import *
 
 class SpaceFOMDynamicalEntityObject(SpaceFOMPhysicalEntityObject):
 
+   # DynamicalEntity attributes added to the PhysicalEntity attributes:
+   #    (FOM name, trick_data_name suffix, RTI encoding)
+   _DE_ATTR_SPEC = (
+      ( 'force',        '.de_packing_data.force',        THLA_ENC_LITTLE_ENDIAN ),
+      ( 'torque',       '.de_packing_data.torque',       THLA_ENC_LITTLE_ENDIAN ),
+      ( 'mass',         '.de_packing_data.mass',         THLA_ENC_LITTLE_ENDIAN ),
+      ( 'mass_rate',    '.de_packing_data.mass_rate',    THLA_ENC_LITTLE_ENDIAN ),
+      ( 'inertia',      '.de_packing_data.inertia',      THLA_ENC_LITTLE_ENDIAN ),
+      ( 'inertia_rate', '.de_packing_data.inertia_rate', THLA_ENC_LITTLE_ENDIAN ) )
+
    def __init__( self,
                  create_entity_object,
                  entity_instance_name,
@@ -28,7 +38,7 @@ class SpaceFOMDynamicalEntityObject(SpaceFOMPhysicalEntityObject):
                  entity_S_define_instance_name,
                  entity_conditional         = None,
                  entity_lag_comp            = None,
-                 entity_lag_comp_type       = trick.TrickHLA.LAG_COMPENSATION_NONE,
+                 entity_lag_comp_type       = THLA_LAG_NONE,
                  entity_ownership           = None,
                  entity_deleted             = None,
                  entity_thla_manager_object = None ):
@@ -78,74 +88,8 @@ class SpaceFOMDynamicalEntityObject(SpaceFOMPhysicalEntityObject):
       # Add the PhysicalEntity attributes.
       SpaceFOMPhysicalEntityObject.add_attributes(self)
 
-      # Short cut the sim_object name for the DynamicalEntity data.
-      entity_instance_name = self.trick_entity_sim_obj_name
-
-      ## Set up the map to the DynamicalEntity's force.
-      trick_data_name = str(entity_instance_name) + '.de_packing_data.force'
-      attribute = TrickHLAAttributeConfig( 'force',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the DynamicalEntity's torque.
-      trick_data_name = str(entity_instance_name) + '.de_packing_data.torque'
-      attribute = TrickHLAAttributeConfig( 'torque',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the DynamicalEntity's mass.
-      trick_data_name = str(entity_instance_name) + '.de_packing_data.mass'
-      attribute = TrickHLAAttributeConfig( 'mass',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the DynamicalEntity's mass rate.
-      trick_data_name = str(entity_instance_name) + '.de_packing_data.mass_rate'
-      attribute = TrickHLAAttributeConfig( 'mass_rate',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the DynamicalEntity's inertia tensor.
-      trick_data_name = str(entity_instance_name) + '.de_packing_data.inertia'
-      attribute = TrickHLAAttributeConfig( 'inertia',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the DynamicalEntity's inertia rate.
-      trick_data_name = str(entity_instance_name) + '.de_packing_data.inertia_rate'
-      attribute = TrickHLAAttributeConfig( 'inertia_rate',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
+      # Add the DynamicalEntity attributes.
+      self.add_attributes_from_schema( self.trick_entity_sim_obj_name,
+                                       self._DE_ATTR_SPEC )
 
       return
-
@@ -17,6 +17,21 @@ import trick
 from trick.top import *
 from ..TrickHLA.TrickHLAFederateConfig import *
 
+# Seconds in a day.
+SECONDS_PER_DAY = 24.0 * 60.0 * 60.0
+
+# Offset of TAI from UTC in seconds (leap seconds as of Jan 2019).
+TAI_MINUS_UTC = 37.0
+
+# Offset of TT from TAI in seconds.
+TT_MINUS_TAI = 32.184
+
+# Scenario timeline epoch for 04 Jan 2019 12:00 PM TT expressed as a
+# Truncated Julian Date (TJD) in seconds:
+#    18487.75(days) + 37.0(s) + 32.184(s)
+SCENARIO_EPOCH_TT_04JAN2019 = ( (18487.75 * SECONDS_PER_DAY)
+                                + TAI_MINUS_UTC + TT_MINUS_TAI )
+
 class SpaceFOMFederateConfig(TrickHLAFederateConfig):
    
    # Reference the SpaceFOM Execution Control.
@@ -117,6 +132,22 @@ class SpaceFOMFederateConfig(TrickHLAFederateConfig):
       return
    
    
+   def setup_roles( self,
+                    master = False,
+                    pacing = False,
+                    RRFP   = False ):
+
+      # You can only change the roles before initialize method is called.
+      if self.initialized :
+         print('SpaceFOMFederateConfig.setup_roles(): Warning, already initialized, function ignored!')
+      else:
+         self.set_master_role( master )
+         self.set_pacing_role( pacing )
+         self.set_RRFP_role( RRFP )
+
+      return
+   
+   
    def set_config_S_define_name( self, config_S_define_name ):
       
       # You can only change RRFP state before initialize method is called.
@@ -231,3 +262,17 @@ class SpaceFOMFederateConfig(TrickHLAFederateConfig):
       TrickHLAFederateConfig.initialize( self )
 
       return
+
+
+# The Common Timing Equipment (CTE) timeline allocated for this federate.
+_CTE_timeline = None
+
+def get_CTE_timeline( ):
+
+   # Allocate the CTE timeline on first use and return the same instance on
+   # every later call so that the Trick memory manager only sees one.
+   global _CTE_timeline
+   if _CTE_timeline is None :
+      _CTE_timeline = trick.sim_services.alloc_type( 1, 'TrickHLA::CTETimelineBase' )
+
+   return _CTE_timeline
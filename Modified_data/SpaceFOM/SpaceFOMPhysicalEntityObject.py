@@ -25,6 +25,19 @@ class SpaceFOMPhysicalEntityObject(TrickHLAObjectConfig):
    # Trick simulation object name (constructed).
    trick_entity_sim_obj_name = None
 
+   # PhysicalEntity attribute prototype table shared by all instances:
+   #    (FOM name, trick_data_name suffix, RTI encoding)
+   _ATTR_SPEC = (
+      ( 'name',                    '.pe_packing_data.name',         THLA_ENC_STRING ),
+      ( 'type',                    '.pe_packing_data.type',         THLA_ENC_STRING ),
+      ( 'status',                  '.pe_packing_data.status',       THLA_ENC_STRING ),
+      ( 'parent_reference_frame',  '.pe_packing_data.parent_frame', THLA_ENC_STRING ),
+      ( 'state',                   '.stc_encoder.buffer',           THLA_ENC_NONE ),
+      ( 'acceleration',            '.pe_packing_data.accel',        THLA_ENC_LITTLE_ENDIAN ),
+      ( 'rotational_acceleration', '.pe_packing_data.ang_accel',    THLA_ENC_LITTLE_ENDIAN ),
+      ( 'center_of_mass',          '.pe_packing_data.cm',           THLA_ENC_LITTLE_ENDIAN ),
+      ( 'body_wrt_structural',     '.quat_encoder.buffer',          THLA_ENC_NONE ) )
+
    def __init__( self,
                  create_entity_object,
                  entity_instance_name,
@@ -32,7 +45,7 @@ class SpaceFOMPhysicalEntityObject(TrickHLAObjectConfig):
                  entity_S_define_instance_name,
                  entity_conditional         = None,
                  entity_lag_comp            = None,
-                 entity_lag_comp_type       = trick.TrickHLA.LAG_COMPENSATION_NONE,
+                 entity_lag_comp_type       = THLA_LAG_NONE,
                  entity_ownership           = None,
                  entity_deleted             = None,
                  entity_thla_manager_object = None,
@@ -78,109 +91,12 @@ class SpaceFOMPhysicalEntityObject(TrickHLAObjectConfig):
 
       return
 
+
    def add_attributes( self ):
 
-      # Short cut the sim_object name for the PhysicalEntity data.
-      entity_instance_name = self.trick_entity_sim_obj_name
-
-      ## Set up the map to the reference PhysicalEntity's name.
-      trick_data_name = str(entity_instance_name) + '.pe_packing_data.name'
-      attribute = TrickHLAAttributeConfig( 'name',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_UNICODE_STRING )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the reference PhysicalEntity's type.
-      trick_data_name = str(entity_instance_name) + '.pe_packing_data.type'
-      attribute = TrickHLAAttributeConfig( 'type',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_UNICODE_STRING )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the reference PhysicalEntity's status.
-      trick_data_name = str(entity_instance_name) + '.pe_packing_data.status'
-      attribute = TrickHLAAttributeConfig( 'status',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_UNICODE_STRING )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the name of the PhysicalEntity's parent reference frame.
-      trick_data_name = str(entity_instance_name) + '.pe_packing_data.parent_frame'
-      attribute = TrickHLAAttributeConfig( 'parent_reference_frame',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_UNICODE_STRING )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the PhysicalEntity's space/time coordinate state.
-      trick_data_name = str(entity_instance_name) + '.stc_encoder.buffer'
-      attribute = TrickHLAAttributeConfig( 'state',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_NONE )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the PhysicalEntity's translational acceleration.
-      trick_data_name = str(entity_instance_name) + '.pe_packing_data.accel'
-      attribute = TrickHLAAttributeConfig( 'acceleration',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the PhysicalEntity's rotational acceleration.
-      trick_data_name = str(entity_instance_name) + '.pe_packing_data.ang_accel'
-      attribute = TrickHLAAttributeConfig( 'rotational_acceleration',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the PhysicalEntity's center of mass.
-      trick_data_name = str(entity_instance_name) + '.pe_packing_data.cm'
-      attribute = TrickHLAAttributeConfig( 'center_of_mass',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the PhysicalEntity's struct to body attitude quaternion.
-      trick_data_name = str(entity_instance_name) + '.quat_encoder.buffer'
-      attribute = TrickHLAAttributeConfig( 'body_wrt_structural',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_NONE )
-      self.add_attribute( attribute )
+      # Build the per-entity attribute configurations from the shared table.
+      self.add_attributes_from_schema( self.trick_entity_sim_obj_name,
+                                       self._ATTR_SPEC,
+                                       THLA_CONFIG_INIT_CYCLIC )
 
       return
-
@@ -25,6 +25,14 @@ class SpaceFOMPhysicalInterfaceObject(TrickHLAObjectConfig):
    # Trick simulation object name (constructed).
    trick_interface_sim_obj_name = None
 
+   # PhysicalInterface attribute table:
+   #    (FOM name, trick_data_name suffix, RTI encoding)
+   _ATTR_SPEC = (
+      ( 'name',        '.packing_data.name',        THLA_ENC_STRING ),
+      ( 'parent_name', '.packing_data.parent_name', THLA_ENC_STRING ),
+      ( 'position',    '.packing_data.position',    THLA_ENC_LITTLE_ENDIAN ),
+      ( 'attitude',    '.quat_encoder.buffer',      THLA_ENC_NONE ) )
+
    def __init__( self,
                  create_interface_object,
                  interface_instance_name,
@@ -32,7 +40,7 @@ class SpaceFOMPhysicalInterfaceObject(TrickHLAObjectConfig):
                  interface_S_define_instance_name,
                  interface_conditional         = None,
                  interface_lag_comp            = None,
-                 interface_lag_comp_type       = trick.TrickHLA.LAG_COMPENSATION_NONE,
+                 interface_lag_comp_type       = THLA_LAG_NONE,
                  interface_ownership           = None,
                  interface_deleted             = None,
                  interface_thla_manager_object = None,
@@ -81,52 +89,9 @@ class SpaceFOMPhysicalInterfaceObject(TrickHLAObjectConfig):
 
    def add_attributes( self ):
 
-      # Short cut the sim_object name for the PhysicalInterface data.
-      interface_instance_name = self.trick_interface_sim_obj_name
-
-      ## Set up the map to the reference PhysicalInterface's name.
-      trick_data_name = str(interface_instance_name) + '.packing_data.name'
-      attribute = TrickHLAAttributeConfig( 'name',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_UNICODE_STRING )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the name of the PhysicalInterface's parent reference frame.
-      trick_data_name = str(interface_instance_name) + '.packing_data.parent_name'
-      attribute = TrickHLAAttributeConfig( 'parent_name',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_UNICODE_STRING )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the PhysicalInterface's translational acceleration.
-      trick_data_name = str(interface_instance_name) + '.packing_data.position'
-      attribute = TrickHLAAttributeConfig( 'position',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_LITTLE_ENDIAN )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the PhysicalInterface's struct to body attitude quaternion.
-      trick_data_name = str(interface_instance_name) + '.quat_encoder.buffer'
-      attribute = TrickHLAAttributeConfig( 'attitude',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_NONE )
-      self.add_attribute( attribute )
+      # Build the PhysicalInterface attribute list from the attribute table.
+      self.add_attributes_from_schema( self.trick_interface_sim_obj_name,
+                                       self._ATTR_SPEC )
 
       return
 
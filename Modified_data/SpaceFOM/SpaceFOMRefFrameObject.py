@@ -21,6 +21,13 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
 
    trick_frame_sim_obj_name = None
 
+   # Reference frame attribute table:
+   #    (FOM name, trick_data_name suffix, RTI encoding)
+   _ATTR_SPEC = (
+      ( 'name',        '.packing_data.name',        THLA_ENC_STRING ),
+      ( 'parent_name', '.packing_data.parent_name', THLA_ENC_STRING ),
+      ( 'state',       '.stc_encoder.buffer',       THLA_ENC_NONE ) )
+
    def __init__( self,
                  create_frame_object,
                  frame_instance_name,
@@ -30,7 +37,7 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
                  parent_name               = None,
                  frame_conditional         = None,
                  frame_lag_comp            = None,
-                 frame_lag_comp_type       = trick.TrickHLA.LAG_COMPENSATION_NONE,
+                 frame_lag_comp_type       = THLA_LAG_NONE,
                  frame_ownership           = None,
                  frame_deleted             = None,
                  frame_thla_manager_object = None,
@@ -95,41 +102,8 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
 
    def add_attributes( self ):
 
-      # Short cut the sim_object name for the frame data.
-      frame_instance_name = self.trick_frame_sim_obj_name
-
-      ## Set up the map to the reference frame's name.
-      trick_data_name = str(frame_instance_name) + '.packing_data.name'
-      attribute = TrickHLAAttributeConfig( 'name',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_UNICODE_STRING )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the name of the reference frame's parent frame.
-      trick_data_name = str(frame_instance_name) + '.packing_data.parent_name'
-      attribute = TrickHLAAttributeConfig( 'parent_name',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_UNICODE_STRING )
-      self.add_attribute( attribute )
-
-      ## Set up the map to the reference frame's space/time coordinate state.
-      trick_data_name = str(frame_instance_name) + '.stc_encoder.buffer'
-      attribute = TrickHLAAttributeConfig( 'state',
-                                           trick_data_name,
-                                           self.hla_create,
-                                           not self.hla_create,
-                                           self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
-                                           trick.TrickHLA.ENCODING_NONE )
-      self.add_attribute( attribute )
+      # Build the reference frame attribute list from the attribute table.
+      self.add_attributes_from_schema( self.trick_frame_sim_obj_name,
+                                       self._ATTR_SPEC )
 
       return
-
@@ -14,6 +14,7 @@
 #     ((Dan Dexter) (NASA) (June 2021) (--) (Added set_wait_status_time.))
 #     ((Dan Dexter) (NASA) (July 2023) (--) (Added support for HLA base time units.)))
 ##############################################################################
+import re
 import sys
 import trick
 
@@ -214,6 +215,27 @@ class TrickHLAFederateConfig( object ):
       return
 
 
+   def set_CRC_settings( self, crc_host, crc_port ):
+
+      # You can only set the CRC settings before initialize method is called.
+      if self.initialized :
+         print( 'TrickHLAFederateConfig.set_CRC_settings(): Warning, already initialized, function ignored!' )
+      else:
+         # Check the port here so a bad port is not first reported by the RTI.
+         # Only accept a true integer (not a bool) or a string of ASCII digits.
+         if isinstance( crc_port, str ) and re.match( '[0-9]+$', crc_port ) :
+            crc_port = int( crc_port )
+         elif not isinstance( crc_port, int ) or isinstance( crc_port, bool ) :
+            sys.exit( 'TrickHLAFederateConfig.set_CRC_settings(): ERROR: The CRC port specified (crc_port:' + str( crc_port ) + ' ) must be an integer! ' )
+         if ( crc_port < 1 ) or ( crc_port > 65535 ) :
+            sys.exit( 'TrickHLAFederateConfig.set_CRC_settings(): ERROR: The CRC port specified (crc_port:' + str( crc_port ) + ' ) must be between 1 and 65535! ' )
+
+         # Build the Pitch specific local settings designator.
+         self.federate.local_settings = 'crcHost = ' + str( crc_host ) + '\n crcPort = ' + str( crc_port )
+
+      return
+
+
    def set_HLA_base_time_units( self, new_base_time_units ):
 
       # You can only set HLA base time units before initialize method is called.
@@ -348,6 +370,17 @@ class TrickHLAFederateConfig( object ):
       return
 
 
+   def add_sim_objects( self, *sim_objects ):
+
+      # You can only add simulation objects before initialize method is called.
+      if self.initialized :
+         print( 'TrickHLAFederateConfig.add_sim_objects(): Warning, already initialized, function ignored!' )
+      else:
+         self.sim_objects.extend( sim_objects )
+
+      return
+
+
    def add_fed_object( self, fed_object ):
 
       # You can only add federation objects before initialize method is called.
@@ -426,6 +459,19 @@ class TrickHLAFederateConfig( object ):
       return
 
 
+   def add_known_federates( self, known_federates ):
+
+      # You can only add known federates before initialize method is called.
+      if self.initialized :
+         print( 'TrickHLAFederateConfig.add_known_federates(): Warning, already initialized, function ignored!' )
+      else:
+         # Each known federate is an ( is_required, name ) pair.
+         for is_required, name in known_federates:
+            self.known_federates.append( ( is_required, str( name ) ) )
+
+      return
+
+
    def add_FOM_module( self, name ):
 
       # You can only add FOM modules before initialize method is called.
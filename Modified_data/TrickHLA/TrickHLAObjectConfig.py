@@ -15,6 +15,14 @@
 ##############################################################################
 import sys
 import trick
+from .TrickHLAAttributeConfig import *
+
+# TrickHLA settings shared by the object and attribute configurations.
+THLA_LAG_NONE           = trick.TrickHLA.LAG_COMPENSATION_NONE
+THLA_CONFIG_INIT_CYCLIC = trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC
+THLA_ENC_STRING         = trick.TrickHLA.ENCODING_UNICODE_STRING
+THLA_ENC_LITTLE_ENDIAN  = trick.TrickHLA.ENCODING_LITTLE_ENDIAN
+THLA_ENC_NONE           = trick.TrickHLA.ENCODING_NONE
 
 class TrickHLAObjectConfig( object ):
 
@@ -265,6 +273,36 @@ class TrickHLAObjectConfig( object ):
 
       return
 
+
+   def add_attributes_bulk( self, attributes ):
+
+      self.attributes.extend( attributes )
+
+      return
+
+
+   def add_attributes_from_schema( self,
+                                   trick_name_prefix,
+                                   schema,
+                                   config = THLA_CONFIG_INIT_CYCLIC ):
+
+      # The schema is a table of (FOM name, trick_name suffix, RTI encoding)
+      # entries. Objects created locally publish and own their attributes,
+      # other objects subscribe to them.
+      publish   = self.hla_create
+      subscribe = not self.hla_create
+
+      self.add_attributes_bulk( [ TrickHLAAttributeConfig( FOM_name,
+                                                           trick_name_prefix + trick_name_suffix,
+                                                           publish,
+                                                           subscribe,
+                                                           publish,
+                                                           config,
+                                                           rti_encoding )
+                                  for FOM_name, trick_name_suffix, rti_encoding in schema ] )
+
+      return
+
    def set_blocking_cyclic_read( self, blocking_cyclic_read ):
 
       self.hla_blocking_cyclic_read = blocking_cyclic_read
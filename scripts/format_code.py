@@ -12,10 +12,23 @@
 # @revs_end
 
 import sys
+
+# The formatting code relies on features from Python 3.7 and newer.
+if sys.version_info < ( 3, 7 ):
+   sys.exit( 'Python 3.7+ required' )
+
 import os
 import argparse
+import collections
 import shutil
 import subprocess
+import concurrent.futures
+import itertools
+import functools
+import hashlib
+import json
+import re
+import tempfile
 
 from trickhla_message import *
 from trickhla_environment import *
@@ -27,9 +40,15 @@ def main():
    # Setup command line argument parsing.
    parser = argparse.ArgumentParser( prog = 'format_code', \
                                      description = 'Format the TrickHLA source code.' )
+   parser.add_argument( '-a', '--all', help = 'Format all files, ignoring the incremental format cache.', \
+                         action = "store_true" )
    parser.add_argument( '-c', '--clean', help = 'Clean up all the TrickHLA code formatting artifacts.', \
                          action = "store_true" )
+   parser.add_argument( '-b', '--git_base', help = 'Git revision to compare against for the \'git_diff\' option (default: origin/main).', \
+                         default = 'origin/main' )
    parser.add_argument( '-f', '--file', help = 'Process a single file in place.' )
+   parser.add_argument( '-g', '--git_diff', help = 'Only format the source files changed relative to the \'git_base\' revision.', \
+                         action = "store_true" )
    parser.add_argument( '-i', '--in_place', help = 'Format the TrickHLA source code in place.', \
                          action = "store_true" )
    parser.add_argument( '-l', '--llvm_bin', help = 'Path to LLVM binaries.' )
@@ -44,7 +63,7 @@ def main():
 
    # Check for TrickHLA.
    if args.thla_home:
-      trickhla_home = ars.thla_home
+      trickhla_home = args.thla_home
    else:
       trickhla_home = os.environ.get( 'TRICKHLA_HOME' )
       if trickhla_home is None:
@@ -127,36 +146,151 @@ def main():
          TrickHLAMessage.status( 'You chose not to proceed. Exiting!' )
          sys.exit()
 
+   # Work out what to do once here instead of in the directory loop.
+   if args.clean:
+      mode = 'clean'
+   elif args.in_place:
+      mode = 'format-inplace'
+   else:
+      mode = 'format-out'
+
+   # Find the changed source files if only formatting changed files.
+   changed_files = None
+   if args.git_diff and not args.clean and not args.file:
+      changed_files = find_git_changed_files( trickhla_home, args.git_base, args.verbose )
+
+   # Link the format specification once at the top of TrickHLA. The
+   # clang-format '-style=file' option searches the parent directories of
+   # each source file for it.
+   if not args.clean:
+      link_clang_format( trickhla_home, trickhla_scripts, args.test, args.verbose )
+
    # Format only a specific file if specified.
    if args.file:
 
-      if format_file( args.file, clang_format_cmd, trickhla_scripts,
-                      args.in_place, args.test, args.verbose ):
+      # A file outside of TrickHLA will not find the format specification
+      # linked at the top of TrickHLA, so point clang-format straight at it.
+      style = '-style=file'
+      thla_home_path = os.path.realpath( trickhla_home )
+      file_real_path = os.path.realpath( args.file )
+      if os.path.commonpath( [ thla_home_path, file_real_path ] ) != thla_home_path:
+         if clang_format_major_version( clang_format_cmd ) >= STYLE_FILE_PATH_CLANG_FORMAT_VERSION:
+            style = '-style=file:' + os.path.join( trickhla_scripts, 'clang-format' )
+         else:
+            TrickHLAMessage.warning( 'File is outside of TRICKHLA_HOME and will not use the '
+                                     + 'TrickHLA format specification: ' + args.file )
+
+      if format_file( args.file, clang_format_cmd,
+                      args.in_place, args.test, args.verbose, style ):
          TrickHLAMessage.failure( 'Could not format file: ' + args.file )
 
    else:
+      #
+      # Walk the include and source directories once to build the list of
+      # model directory tasks.
+      #
+      tasks = []
       for src_path in trickhla_src_paths:
-         #
-         # Format the include and source directories.
-         #
-         os.chdir( src_path )
          if args.verbose:
-            if args.clean:
+            if mode == 'clean':
                TrickHLAMessage.status( 'Cleaning directory: ' + src_path )
             else:
                TrickHLAMessage.status( 'Formatting directory: ' + src_path )
-         dir_list = os.listdir( '.' )
-         for dir_entry in dir_list:
+         for dir_entry in os.scandir( src_path ):
             # Only interested in directories. There really should not be any files.
-            if os.path.isfile( dir_entry ): continue
-            # Either clean up or format the model directory.
-            if args.clean:
-               cleanup_directory( dir_entry, args.test, args.verbose )
+            if dir_entry.is_file(): continue
+            dir_path = dir_entry.path
+            if mode == 'clean':
+               files = []
             else:
-               if format_directory( dir_entry, clang_format_cmd, trickhla_scripts,
-                                    args.in_place, args.test, args.verbose ):
-                  TrickHLAMessage.failure( 'Could not format directory: ' + dir_entry )
-         # End: for dir_entry in dir_list :
+               # Skip directories without any changed files.
+               if changed_files is not None and dir_path not in changed_files:
+                  continue
+               files = prepare_directory( dir_path,
+                                          mode == 'format-inplace',
+                                          args.test,
+                                          args.verbose )
+               # Only keep the changed files if using git to find them.
+               if changed_files is not None:
+                  files = [ file_path for file_path in files
+                            if file_path in changed_files[dir_path] ]
+            tasks.append( Task( dir_path, files, mode, args.test, args.verbose ) )
+         # End: for dir_entry in os.scandir( src_path ) :
+
+      # Either clean up each model directory or collect its source files.
+      format_files = []
+      for task in tasks:
+         if task.mode == 'clean':
+            cleanup_directory( task.dir, task.test, task.verbose )
+         else:
+            format_files.extend( task.files )
+
+      # When formatting in place, skip the files that have not changed since
+      # they were last formatted with the same clang-format version and
+      # format specification.
+      use_cache = mode == 'format-inplace' and not args.test
+      if use_cache:
+         format_cache = FormatCache( os.path.join( trickhla_scripts, FORMAT_CACHE_FILE ),
+                                     trickhla_home,
+                                     clang_format_cmd,
+                                     os.path.join( trickhla_scripts, 'clang-format' ) )
+         if not args.all:
+            format_cache.load()
+         cached_count = len( format_files )
+         format_files = [ file_path for file_path in format_files
+                          if format_cache.is_changed( file_path ) ]
+         if args.verbose:
+            TrickHLAMessage.status( 'Skipping ' + str( cached_count - len( format_files ) )
+                                    + ' unchanged files.' )
+
+      # Newer versions of clang-format can read the list of files to format
+      # from a response file, which keeps long file lists off the command line.
+      use_response_file = clang_format_major_version( clang_format_cmd ) >= RESPONSE_FILE_CLANG_FORMAT_VERSION
+
+      # Split the source files into about two chunks per CPU so that workers
+      # that finish early can pick up the remaining chunks. Round the chunk
+      # size up so the files are not left with a small remainder chunk.
+      if format_files:
+         chunk_count = 2 * ( os.cpu_count() or 1 )
+         chunk_size = max( 1, -( -len( format_files ) // chunk_count ) )
+         file_chunks = [ format_files[indx:indx + chunk_size]
+                         for indx in range( 0, len( format_files ), chunk_size ) ]
+
+         # Format the chunks of files in parallel.
+         with concurrent.futures.ProcessPoolExecutor() as executor:
+            results = executor.map( format_source_files,
+                                         file_chunks,
+                                         itertools.repeat( clang_format_cmd ),
+                                         itertools.repeat( mode == 'format-inplace' ),
+                                         itertools.repeat( args.test ),
+                                         itertools.repeat( args.verbose ),
+                                         itertools.repeat( use_response_file ) )
+
+            # Print the clang-format output and diagnostics one chunk at a
+            # time so that the output from the workers does not interleave.
+            error_state = False
+            for returncode, stdout_output, stderr_output in results:
+               if stdout_output:
+                  sys.stdout.write( stdout_output.decode( 'utf8', errors = 'replace' ) )
+               if stderr_output:
+                  sys.stderr.write( stderr_output.decode( 'utf8', errors = 'replace' ) )
+               if returncode != 0:
+                  error_state = True
+            if error_state:
+               TrickHLAMessage.failure( 'Could not format all the source files!' )
+
+      # Record the formatted state of the files.
+      if use_cache:
+         for file_path in format_files:
+            format_cache.update( file_path )
+         format_cache.save()
+
+      # Cleaning up also removes the format specification link and the
+      # incremental format cache.
+      if mode == 'clean':
+         remove_clang_format_link( trickhla_home, args.test, args.verbose )
+         cleanup_format_cache( os.path.join( trickhla_scripts, FORMAT_CACHE_FILE ),
+                               args.test, args.verbose )
    # End: args.file :
 
    # Let the user know that we are done.
@@ -170,14 +304,302 @@ def main():
    return
 
 
+# A model directory to clean up or format, with its source files to format.
+Task = collections.namedtuple( 'Task', 'dir files mode test verbose' )
+
+# File extensions of the source files to format.
+SOURCE_FILE_EXTENSIONS = ( '.hh', '.h', '.cpp', '.c' )
+
+# Name of the incremental format cache file in the TrickHLA scripts directory.
+FORMAT_CACHE_FILE = '.format_cache.json'
+
+# Oldest clang-format major version we pass a response file of file names.
+RESPONSE_FILE_CLANG_FORMAT_VERSION = 14
+
+# Oldest clang-format major version that takes a '-style=file:<path>' option.
+STYLE_FILE_PATH_CLANG_FORMAT_VERSION = 14
+
+# Room left on the command line for the environment and other overhead.
+ARG_MAX_HEADROOM = 4096
+
+
+# Class to keep track of the files that are already formatted.
+#
+# The cache records the modification time, size and content hash of each
+# file after it was formatted in place. The cache is only valid for the
+# clang-format version and format specification it was built with.
+#
+class FormatCache():
+
+   # Construct the format cache.
+   #
+   # @param cache_path        The path to the cache file.
+   # @param root_path         The path the cached file paths are relative to.
+   # @param clang_format_cmd  The path to the CLANG format command.
+   # @param clang_format_spec The path to the format specification file.
+   #
+   def __init__( self, cache_path, root_path, clang_format_cmd, clang_format_spec ):
+
+      self.cache_path = cache_path
+      self.root_path  = root_path
+      self.files      = {}
+
+      self.clang_format_version = find_clang_format_version( clang_format_cmd )
+
+      self.config_hash = FormatCache.hash_file( clang_format_spec )
+
+      return
+
+
+   # Compute the hash of the contents of a file.
+   #
+   # @return file_hash  The hex digest of the file contents.
+   # @param  file_path  The path to the file.
+   #
+   @staticmethod
+   def hash_file( file_path ):
+
+      try:
+         with open( file_path, 'rb' ) as file:
+            return hashlib.blake2b( file.read() ).hexdigest()
+      except OSError:
+         return ''
+
+
+   # Load the cache file, dropping it if built with another configuration.
+   def load( self ):
+
+      try:
+         with open( self.cache_path, 'r' ) as cache_file:
+            cache = json.load( cache_file )
+      except ( OSError, ValueError ):
+         return
+
+      if    cache.get( 'clang_format_version' ) == self.clang_format_version \
+        and cache.get( 'config_hash' ) == self.config_hash:
+         self.files = cache.get( 'files', {} )
+
+      return
+
+
+   # Atomically write the cache file.
+   def save( self ):
+
+      cache = { 'clang_format_version' : self.clang_format_version,
+                'config_hash'          : self.config_hash,
+                'files'                : self.files }
+
+      tmp_path = self.cache_path + '.tmp'
+      with open( tmp_path, 'w' ) as cache_file:
+         json.dump( cache, cache_file, indent = 1, sort_keys = True )
+      os.replace( tmp_path, self.cache_path )
+
+      return
+
+
+   # Check if a file has changed since it was last formatted.
+   #
+   # @return changed    True if the file needs to be formatted.
+   # @param  file_path  The path to the file.
+   #
+   def is_changed( self, file_path ):
+
+      entry = self.files.get( os.path.relpath( file_path, self.root_path ) )
+      if entry is None:
+         return True
+
+      stat = os.stat( file_path )
+      if entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+         return False
+
+      # The file was touched, so compare the contents.
+      if entry[2] == FormatCache.hash_file( file_path ):
+         entry[0] = stat.st_mtime_ns
+         return False
+
+      return True
+
+
+   # Record the state of a freshly formatted file.
+   #
+   # @param file_path  The path to the file.
+   #
+   def update( self, file_path ):
+
+      stat = os.stat( file_path )
+      self.files[os.path.relpath( file_path, self.root_path )] = [ stat.st_mtime_ns,
+                                                                   stat.st_size,
+                                                                   FormatCache.hash_file( file_path ) ]
+
+      return
+
+
+# Function to remove the incremental format cache file.
+#
+# @param cache_path  The path to the cache file.
+# @param test_only   Flag indicating to only show what would be done.
+# @param verbose     Flag to set if verbose outputs are on.
+#
+def cleanup_format_cache( cache_path, test_only = False, verbose = True ):
+
+   if os.path.isfile( cache_path ):
+      if test_only:
+         TrickHLAMessage.status( 'Would remove format cache: ' + cache_path )
+      else:
+         if verbose:
+            TrickHLAMessage.status( 'Removing format cache: ' + cache_path )
+         os.remove( cache_path )
+
+   return
+
+
+# Function to find the source files changed relative to a git revision.
+#
+# This function asks git for the added, copied, modified and renamed files
+# relative to the given revision. If git is not available or the TrickHLA
+# directory is not a git worktree then all the files will be formatted.
+#
+# @return changed_files  Map of directory paths to the set of changed
+#                        source file paths in them, or None on failure.
+# @param  thla_home      The path to the TrickHLA directory.
+# @param  git_base       The git revision to compare against.
+# @param  verbose        Flag to set if verbose outputs are on.
+#
+def find_git_changed_files( thla_home, git_base, verbose = True ):
+
+   git_diff_cmd = [ 'git', 'diff', '--name-only', '--relative', '--diff-filter=ACMR', git_base ]
+   try:
+      git_output = subprocess.check_output( git_diff_cmd,
+                                            cwd = thla_home,
+                                            stderr = subprocess.PIPE ).decode( 'utf8', errors = 'strict' )
+   except OSError as error:
+      TrickHLAMessage.warning( 'Could not get the changed files from git ('
+                               + str( error ) + '), formatting all files.' )
+      return None
+   except subprocess.CalledProcessError as error:
+      # Only report the first line, git may follow it with its usage text.
+      git_error = error.stderr.decode( 'utf8', errors = 'replace' ).strip().splitlines()
+      git_error = git_error[0] if git_error else 'exit status ' + str( error.returncode )
+      TrickHLAMessage.warning( 'Could not get the changed files from git ('
+                               + git_error + '), formatting all files.' )
+      return None
+
+   changed_files = {}
+   for file in git_output.splitlines():
+      if file.endswith( SOURCE_FILE_EXTENSIONS ):
+         file_path = os.path.join( thla_home, file )
+         changed_files.setdefault( os.path.dirname( file_path ), set() ).add( file_path )
+
+   if verbose:
+      TrickHLAMessage.status( 'Found ' + str( sum( len( files ) for files in changed_files.values() ) )
+                              + ' changed source files relative to: ' + git_base )
+
+   return changed_files
+
+
+# Function to find the version of the clang-format command.
+#
+# @return version_string    The clang-format version output, or an empty
+#                           string if it could not be determined.
+# @param  clang_format_cmd  The path to the CLANG format command.
+#
+@functools.lru_cache( maxsize = 1 )
+def find_clang_format_version( clang_format_cmd ):
+
+   try:
+      version_string = subprocess.check_output( [ clang_format_cmd, '--version' ] ).decode( 'utf8', errors = 'strict' ).strip()
+   except ( OSError, subprocess.CalledProcessError ):
+      version_string = ''
+
+   return version_string
+
+
+# Function to find the major version of the clang-format command.
+#
+# @return major_version     The clang-format major version, or 0 if it
+#                           could not be determined.
+# @param  clang_format_cmd  The path to the CLANG format command.
+#
+def clang_format_major_version( clang_format_cmd ):
+
+   # clang-format version 14.0.6
+   version_match = re.search( r'version (\d+)\.', find_clang_format_version( clang_format_cmd ) )
+   if version_match is None:
+      major_version = 0
+   else:
+      major_version = int( version_match.group( 1 ) )
+
+   return major_version
+
+
+# Function to split a command into batches that fit on the command line.
+#
+# The base command is repeated for each batch of files so that no single
+# command exceeds the system argument size limit.
+#
+# @return commands      The list of commands covering all the files.
+# @param  base_command  The command arguments to start each batch with.
+# @param  files         The list of paths to the files to format.
+#
+def batch_commands( base_command, files ):
+
+   try:
+      arg_max = os.sysconf( 'SC_ARG_MAX' )
+   except ( AttributeError, ValueError, OSError ):
+      arg_max = 131072
+
+   # The environment counts against the same limit as the arguments.
+   env_size = sum( len( key ) + len( value ) + 2 for key, value in os.environ.items() )
+   arg_limit = max( 1, arg_max - env_size - ARG_MAX_HEADROOM )
+
+   base_size = sum( len( arg ) + 1 for arg in base_command )
+   commands  = []
+   command   = list( base_command )
+   size      = base_size
+   for file_path in files:
+      file_size = len( file_path ) + 1
+      if size + file_size > arg_limit and len( command ) > len( base_command ):
+         commands.append( command )
+         command = list( base_command )
+         size    = base_size
+      command.append( file_path )
+      size += file_size
+   if len( command ) > len( base_command ):
+      commands.append( command )
+
+   return commands
+
+
+# Function to write a clang-format response file for a list of files.
+#
+# @return response_path  The path to the response file.
+# @param  files          The list of paths to the files to format.
+#
+def write_response_file( files ):
+
+   with tempfile.NamedTemporaryFile( mode = 'w',
+                                     prefix = 'thla_fmt_',
+                                     suffix = '.txt',
+                                     delete = False ) as response_file:
+      for file_path in files:
+         # Quote each path since the response file is split on white space.
+         response_file.write( '"' + file_path.replace( '\\', '\\\\' ).replace( '"', '\\"' ) + '"\n' )
+
+   return response_file.name
+
+
 # Function to find the clang-format command.
 #
 # This function searches common locations for the clang-format command.
 # If the llvm-bin a
 #
+# The result is cached so that repeated lookups do not probe the file
+# system again.
+#
 # @param llvm_bin  The path to the LLVM programs directory.
 # @param verbose   Flag to set if verbose outputs are on.
 #
+@functools.lru_cache( maxsize = 1 )
 def find_clang_format( llvm_bin, verbose = True ):
 
    # Initialize the clang-format command path.
@@ -255,10 +677,7 @@ def find_clang_format( llvm_bin, verbose = True ):
                   llvm_versions = os.listdir( '/usr/local/Cellar/llvm' )
    
                   # Assume we will be using the latest version.
-                  llvm_version = llvm_versions[0]
-                  for version in llvm_versions:
-                     if version > llvm_version:
-                        llvm_version = version
+                  llvm_version = max( llvm_versions )
    
                   # Generate the clang-format command.
                   bin_path = os.path.join( '/usr/local/Cellar/llvm', llvm_version )
@@ -298,57 +717,78 @@ def find_clang_format( llvm_bin, verbose = True ):
 # This check if the .clang-format file exists. If not, it links to the
 # base .clang-format file in the TrickHLA scripts directory.
 #
+# @param dir_path      The path to the directory to link the file in.
 # @param thla_scripts  The path to the TrickHLA scripts directory.
 # @param test_only     Flag indicating to only show what would be done.
 # @param verbose       Flag to set if verbose outputs are on.
 #
-def link_clang_format( thla_scripts, test_only = False, verbose = True ):
+def link_clang_format( dir_path, thla_scripts, test_only = False, verbose = True ):
 
    thla_clang_format = os.path.join( thla_scripts, 'clang-format' )
+   clang_format_link = os.path.join( dir_path, '.clang-format' )
 
-   # Check for the .clang-format file.
-   if os.path.isfile( '.clang-format' ):
-      if verbose:
-         TrickHLAMessage.status( 'Found existing format specification file: .clang-format' )
-   if os.path.islink( '.clang-format' ):
+   # Check for an existing .clang-format file or link.
+   if os.path.lexists( clang_format_link ):
       if verbose:
-         TrickHLAMessage.status( 'Found existing format specification link: .clang-format' )
+         TrickHLAMessage.status( 'Found existing format specification: ' + clang_format_link )
+   elif test_only:
+      TrickHLAMessage.status( 'Would link format specification: '
+                              + thla_clang_format )
    else:
-      if test_only:
-         TrickHLAMessage.status( 'Would link format specification: '
+      os.symlink( thla_clang_format, clang_format_link )
+      if verbose:
+         TrickHLAMessage.status( 'Linking to format specification: '
                                  + thla_clang_format )
+
+   return
+
+
+# Function to remove the .clang-format link.
+#
+# @param dir_path   The path to the directory to remove the link from.
+# @param test_only  Flag indicating to only show what would be done.
+# @param verbose    Flag to set if verbose outputs are on.
+#
+def remove_clang_format_link( dir_path, test_only = False, verbose = True ):
+
+   clang_format_link = os.path.join( dir_path, '.clang-format' )
+
+   # Check for the '.clang-format' file and remove it if a link.
+   if os.path.islink( clang_format_link ):
+      if test_only:
+         TrickHLAMessage.status( 'Would remove \'.clang-format\' link: ' + clang_format_link )
       else:
-         os.symlink( thla_clang_format, '.clang-format' )
          if verbose:
-            TrickHLAMessage.status( 'Linking to format specification: '
-                                    + thla_clang_format )
+            TrickHLAMessage.status( 'Removing \'.clang-format\' link: ' + clang_format_link )
+         os.remove( clang_format_link )
+      # End: if test_only :
+   # End: if os.path.islink( clang_format_link ) :
 
    return
 
 
 # Function to format a specific source file.
 #
-# This routine will format a specified source file if it exists. The
-# routine saves the current working directory and then moves to the
-# directory in which the file exists. If not, the routine returns with an
-# error condition. If the file exists, this routine runs the clang-format
-# command on the specified file.
+# This routine will format a specified source file if it exists. If not,
+# the routine returns with an error condition. If the file exists, this
+# routine runs the clang-format command on the specified file from the
+# directory in which the file exists.
 #
 # @return error_state       The error status for the file formatting.
 # @param  file_path         The path to the file to format.
 # @param  clang_format_cmd  The path to the CLANG format command.
-# @param  thla_scripts      The path to the TrickHLA scripts directory.
 # @param  in_place          Flag indicating files should be formatted in place.
 # @param  test_only         Flag indicating to only show what would be done.
 # @param  verbose           Flag to set if verbose outputs are on.
+# @param  style             The clang-format style option to use.
 #
 def format_file( 
    file_path,
    clang_format_cmd,
-   thla_scripts,
    in_place = False,
    test_only = False,
-   verbose = True ):
+   verbose = True,
+   style = '-style=file' ):
 
    error_state = False  # No error yet.
 
@@ -364,29 +804,23 @@ def format_file(
       return error_state
 
    # Extract the directory path to the file and the file base name.
-   dir_path = os.path.dirname( file_path )
+   dir_path = os.path.dirname( os.path.abspath( file_path ) )
    file = os.path.basename( file_path )
-
-   # Move into the directory.
-   original_dir = os.path.abspath( os.path.curdir )
-   os.chdir( dir_path )
-
-   # Check for the .clang-format file.
-   link_clang_format( thla_scripts, test_only, verbose )
+   formatted_dir = os.path.join( dir_path, 'formatted' )
 
    # Check to see if we are formatting in place.
    if not in_place:
 
       # We need to create the 'formatted' directory is it does not
       # already exist.
-      if not os.path.isdir( 'formatted' ):
+      if not os.path.isdir( formatted_dir ):
          if test_only:
             if verbose:
                TrickHLAMessage.status( 'Would create \'formatted\' directory:' )
          else:
             if verbose:
                TrickHLAMessage.status( 'Creating \'formatted\' directory:' )
-            os.mkdir( 'formatted' )
+            os.mkdir( formatted_dir )
       # else :
          # We should probably clean out the directory if it exists
          # but we are not going to do that.
@@ -399,13 +833,13 @@ def format_file(
    # Execute different command depending on 'in place' setting.
    if in_place:
 
-      # Build the clang-format command string.
-      command = clang_format_cmd + ' -style=file -i ' + file
+      # Build the clang-format command.
+      command = [ clang_format_cmd, style, '-i', file ]
 
       if test_only:
 
          TrickHLAMessage.status( 'Would format file in place with command:' )
-         TrickHLAMessage.status( '   ' + command )
+         TrickHLAMessage.status( '   ' + ' '.join( command ) )
 
       else:
 
@@ -413,155 +847,225 @@ def format_file(
             TrickHLAMessage.status( 'Formatting in place: ' + file )
 
          # Execute the command.
-         os.system( command )
+         subprocess.run( command, cwd = dir_path, check = False )
 
    else:
 
-      # Build the clang-format command string.
-      command = clang_format_cmd + ' -style=file ' + file + ' > formatted/' + file
+      # Build the clang-format command.
+      command = [ clang_format_cmd, style, file ]
+      formatted_path = os.path.join( 'formatted', file )
 
       if test_only:
 
          TrickHLAMessage.status( 'Would format file with command:' )
-         TrickHLAMessage.status( '   ' + command )
+         TrickHLAMessage.status( '   ' + ' '.join( command ) + ' > ' + formatted_path )
 
       else:
          if verbose:
             TrickHLAMessage.status( 'Formatting in \'formatted\': ' + file )
 
-         # Execute the command.
-         os.system( command )
+         # Execute the command, writing the output to the 'formatted' directory.
+         with open( os.path.join( dir_path, formatted_path ), 'wb' ) as formatted_file:
+            subprocess.run( command, cwd = dir_path, stdout = formatted_file, check = False )
 
    # End: if in_place :
 
-   # Move back to the original directory.
-   os.chdir( original_dir )
-
    return error_state
 
 
-# Function to format all the identifiable source files in a directory.
+# Function to prepare a directory for formatting.
 #
-# This routine will format all the identifiable source files in a given
-# directory. The routine saves the current working directory and then
-# moves to the specified directory if it exists. If not, the routine
-# returns with an error condition. If the directory exists, this routine
-# runs the clang-format command on all identifiable source files in the
-# directory.
+# This routine will set up a given directory for formatting and find all
+# the identifiable source files in it. It creates the 'formatted' directory
+# if not formatting in place.
 #
-# @return error_state       The error status for the directory formatting.
+# @return files             The sorted list of paths to the source files.
 # @param  dir_path          The path to directory to format.
-# @param  clang_format_cmd  The path to the CLANG format command.
-# @param  thla_scripts      The path to the TrickHLA scripts directory.
 # @param  in_place          Flag indicating files should be formatted in place.
 # @param  test_only         Flag indicating to only show what would be done.
 # @param  verbose           Flag to set if verbose outputs are on.
 #
-def format_directory( 
+def prepare_directory( 
    dir_path,
-   clang_format_cmd,
-   thla_scripts,
    in_place = False,
    test_only = False,
    verbose = True ):
 
-   error_state = False  # No error yet.
-
-   # Move into the directory.
    if verbose:
       TrickHLAMessage.status( 'Formatting ' + dir_path + ' directory:' )
-   original_dir = os.path.abspath( os.path.curdir )
-   os.chdir( dir_path )
-
-   # Check for the .clang-format file.
-   link_clang_format( thla_scripts, test_only, verbose )
+   formatted_dir = os.path.join( dir_path, 'formatted' )
 
    # Check to see if we are formatting in place.
    if not in_place:
 
       # We need to create the 'formatted' directory is it does not
       # already exist.
-      if not os.path.isdir( 'formatted' ):
+      if not os.path.isdir( formatted_dir ):
          if test_only:
             if verbose:
                TrickHLAMessage.status( 'Would create \'formatted\' directory:' )
          else:
             if verbose:
                TrickHLAMessage.status( 'Creating \'formatted\' directory:' )
-            os.mkdir( 'formatted' )
+            os.mkdir( formatted_dir )
       # else :
          # We should probably clean out the directory if it exists
          # but we are not going to do that.
    # End: if not in_place :
 
-   # Now format recognized files in the directory.
-   dir_list = os.listdir( '.' )
-   for file in dir_list:
+   # Now find the recognized files in the directory.
+   # The directory entries carry the file type from the directory read, so
+   # this does not need a separate stat call for each file.
+   files = []
+   for entry in os.scandir( dir_path ):
 
-      # Only process files.
-      if os.path.isfile( file ) and not os.path.islink( file ):
+      # Only process regular files with the source file extensions.
+      if entry.is_file( follow_symlinks = False ) \
+         and entry.name.endswith( SOURCE_FILE_EXTENSIONS ):
+         files.append( entry.path )
 
-         # Only interested in files with certain extensions.
-         if    file.endswith( '.hh' ) \
-            or file.endswith( '.h' ) \
-            or file.endswith( '.cpp' ) \
-            or file.endswith( '.c' ):
+   # End: for entry in os.scandir( dir_path ) :
 
-            # Execute different command depending on 'in place' setting.
-            if in_place:
+   files.sort()
 
-               # Build the clang-format command string.
-               command = clang_format_cmd + ' -style=file -i ' + file
+   return files
 
-               if test_only:
 
-                  TrickHLAMessage.status( 'Would format file in place with command:' )
-                  TrickHLAMessage.status( '   ' + command )
+# Function to run a clang-format command and capture its output.
+#
+# @return returncode  The exit status of the clang-format command.
+# @return stdout      The captured standard output, or None if not captured.
+# @return stderr      The standard error output of the clang-format command.
+# @param  command     The clang-format command to run.
+# @param  stdout      Where to send the standard output of the command.
+#
+def run_clang_format( command, stdout = subprocess.DEVNULL ):
 
-               else:
+   result = subprocess.run( command,
+                            stdout = stdout,
+                            stderr = subprocess.PIPE,
+                            check = False )
 
-                  if verbose:
-                     TrickHLAMessage.status( 'Formatting in place: ' + file )
+   return result.returncode, result.stdout, result.stderr
 
-                  # Execute the command.
-                  os.system( command )
 
-            else:
+# Function to format a list of source files.
+#
+# This routine will format all the source files in the given list. When
+# formatting in place, all the files are formatted with a single
+# clang-format invocation so that we only pay the clang-format startup
+# cost once per list. The file names are passed in a response file if
+# supported, otherwise in as few commands as fit on the command line.
+# When not formatting in place, each file is formatted into the
+# 'formatted' directory next to it. The clang-format output and diagnostics
+# are returned instead of printed so that the caller can print them in order.
+# The in place standard output is only kept for verbose output.
+#
+# @return returncode         The first non-zero clang-format exit status, or 0.
+# @return stdout             The collected in place clang-format standard output.
+# @return stderr             The collected clang-format standard error output.
+# @param  files              The list of paths to the files to format.
+# @param  clang_format_cmd   The path to the CLANG format command.
+# @param  in_place           Flag indicating files should be formatted in place.
+# @param  test_only          Flag indicating to only show what would be done.
+# @param  verbose            Flag to set if verbose outputs are on.
+# @param  use_response_file  Flag to pass the files in a response file.
+#
+def format_source_files( 
+   files,
+   clang_format_cmd,
+   in_place = False,
+   test_only = False,
+   verbose = True,
+   use_response_file = False ):
 
-               # Build the clang-format command string.
-               command = clang_format_cmd + ' -style=file ' + file + ' > formatted/' + file
+   returncode    = 0  # No error yet.
+   stdout_output = []
+   stderr_output = []
 
-               if test_only:
+   # Execute different command depending on 'in place' setting.
+   if in_place:
 
-                  TrickHLAMessage.status( 'Would format file with command:' )
-                  TrickHLAMessage.status( '   ' + command )
+      # Build the clang-format command.
+      base_command = [ clang_format_cmd, '-style=file', '-i' ]
 
-               else:
-                  if verbose:
-                     TrickHLAMessage.status( 'Formatting in \'formatted\': ' + file )
+      if test_only:
+
+         TrickHLAMessage.status( 'Would format files in place with command:' )
+         TrickHLAMessage.status( '   ' + ' '.join( base_command + files ) )
+
+      else:
 
-                  # Execute the command.
-                  os.system( command )
+         # Only keep the clang-format standard output for verbose output.
+         if verbose:
+            for file_path in files:
+               TrickHLAMessage.status( 'Formatting in place: ' + file_path )
+            stdout = subprocess.PIPE
+         else:
+            stdout = subprocess.DEVNULL
 
-            # End: if in_place :
+         if use_response_file:
 
-      # End: if os.path.isfile( file ) and not os.path.islink( file ) :
+            # Execute the command with the files listed in a response file.
+            response_path = write_response_file( files )
+            try:
+               results = [ run_clang_format( base_command + [ '@' + response_path ], stdout ) ]
+            finally:
+               os.remove( response_path )
 
-   # End: for file in dir_list :
+         else:
 
-   # Move back to the original directory.
-   os.chdir( original_dir )
+            # Execute the commands for each batch of files.
+            results = [ run_clang_format( command, stdout )
+                        for command in batch_commands( base_command, files ) ]
 
-   return error_state
+         for command_returncode, command_stdout, command_stderr in results:
+            if returncode == 0:
+               returncode = command_returncode
+            if command_stdout:
+               stdout_output.append( command_stdout )
+            stderr_output.append( command_stderr )
+
+   else:
+
+      # Formatting to the 'formatted' directory requires redirecting the
+      # output of clang-format for each file separately.
+      for file_path in files:
+
+         # Build the clang-format command.
+         formatted_path = os.path.join( os.path.dirname( file_path ),
+                                        'formatted',
+                                        os.path.basename( file_path ) )
+         command = [ clang_format_cmd, '-style=file', file_path ]
+
+         if test_only:
+
+            TrickHLAMessage.status( 'Would format file with command:' )
+            TrickHLAMessage.status( '   ' + ' '.join( command ) + ' > ' + formatted_path )
+
+         else:
+            if verbose:
+               TrickHLAMessage.status( 'Formatting in \'formatted\': ' + file_path )
+
+            # Execute the command, writing the output to the 'formatted' directory.
+            with open( formatted_path, 'wb' ) as formatted_file:
+               command_returncode, _, command_stderr = run_clang_format( command, formatted_file )
+            if returncode == 0:
+               returncode = command_returncode
+            stderr_output.append( command_stderr )
+
+      # End: for file_path in files :
+
+   # End: if in_place :
+
+   return returncode, b''.join( stdout_output ), b''.join( stderr_output )
 
 
 # Function to cleans up all the formatting artifacts in a directory.
 #
 # This routine will clean up all the identifiable formatting artifacts in
-# a given directory. The routine saves the current working directory and
-# then moves to the specified directory if it exists. If not, the routine
-# returns with an error condition. If the directory exists, this routine
-# removes the formatted directory.
+# a given directory. This routine removes the formatted directory and any
+# '.clang-format' link left by older versions of this script.
 #
 # @param  dir_path     The path to the directory to clean up.
 # @param  test_only    Flag indicating to only show what would be done.
@@ -572,54 +1076,35 @@ def cleanup_directory(
    test_only = False,
    verbose = True ):
 
-   # Move into the directory.
    if verbose:
       TrickHLAMessage.status( 'Cleaning up directory: ' + dir_path )
-   original_dir = os.path.abspath( os.path.curdir )
-   os.chdir( dir_path )
+   formatted_dir = os.path.join( dir_path, 'formatted' )
 
-   # Check for the '.clang-format' file and remove it if a link.
-   if os.path.islink( '.clang-format' ):
-      if test_only:
-         TrickHLAMessage.status( 'Would remove \'.clang-format\' link.' )
-      else:
-         if verbose:
-            TrickHLAMessage.status( 'Removing \'.clang-format\' link.' )
-         os.remove( '.clang-format' )
-      # End: if test_only :
-   # End: if os.path.islink( '.clang-format' ) :
+   # Remove any '.clang-format' link left by older versions of this script.
+   remove_clang_format_link( dir_path, test_only, verbose )
 
    # Check for the 'formatted' directory.
-   if os.path.isdir( 'formatted' ):
+   if os.path.isdir( formatted_dir ):
       if test_only:
          TrickHLAMessage.status( 'Would remove \'formatted\' directory.' )
       else:
          if verbose:
             TrickHLAMessage.status( 'Removing \'formatted\' directory.' )
-         # This is not a test, so remove the directory.
-         for root, dirs, files in os.walk( 'formatted' ):
-            # Remove all the files in the formatted directory.
-            # Otherwise, we will not be able to remove the directory.
-            for file in files:
-               # Need to prepend root directory to get the full path to the file.
-               file_path = os.path.join( root, file )
-               # Remove the file.
-               os.remove( file_path )
-
-         # Remove the formatted directory.
-         os.removedirs( 'formatted' )
+         # This is not a test, so remove the directory and its contents.
+         shutil.rmtree( formatted_dir )
 
       # End: if test_only :
 
    # End: if os.path.isdir( 'formatted' ) :
 
-   # Move back to the original directory.
-   os.chdir( original_dir )
-
    return
 
 
 #
 # Call the main function.
 #
-main()
+# The guard is needed so that worker processes started by the process pool
+# do not run the main function again.
+#
+if __name__ == '__main__':
+   main()
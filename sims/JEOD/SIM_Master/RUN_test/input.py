@@ -54,7 +54,10 @@ def parse_command_line( ) :
    index = 2
    while (index < argc) :
       
-      if (str(argv[index]) == '-stop') :
+      # Convert the argument to a string only once.
+      arg = str(argv[index])
+      
+      if (arg == '-stop') :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -62,32 +65,33 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-nostop') :
+      elif (arg == '-nostop') :
          run_duration = None
          
-      elif ((str(argv[index]) == '-h') | (str(argv[index]) == '-help')) :
+      elif (arg in ('-h', '-help')) :
          print_usage = True
       
-      elif (str(argv[index]) == '-verbose') :
+      elif (arg == '-verbose') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                verbose = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                verbose = False
             else :
-               print('ERROR: Unknown -verbose argument: ' + str(argv[index]))
+               print('ERROR: Unknown -verbose argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -verbose [on|off] argument.')
             print_usage = True
       
-      elif (str(argv[index]) == '-d') :
+      elif (arg == '-d') :
          # Catch the Trick debug command line option an do NOT terminate.
          print('DEBUG: Specified input file debug uption to Trick.')
          
       else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
+         print('ERROR: Unknown command line argument ' + arg)
          print_usage = True
          
       index = index + 1
@@ -184,22 +188,22 @@ else :
 #--------------------------------------------------------------------------
 # Configure this federate SpaceFOM roles for this federate.
 #--------------------------------------------------------------------------
-federate.set_master_role( True ) # This is the Master federate.
-federate.set_pacing_role( True ) # This is also the Pacing federate.
-federate.set_RRFP_role( False )  # This is NOT the Root Reference Frame Publisher.
+federate.setup_roles( master = True,   # This is the Master federate.
+                      pacing = True,   # This is also the Pacing federate.
+                      RRFP   = False ) # This is NOT the Root Reference Frame Publisher.
 
 #--------------------------------------------------------------------------
 # Add in known required federates.
 #--------------------------------------------------------------------------
-federate.add_known_federate( True, str(federate.federate.name) )
-federate.add_known_federate( True, 'JEODRefFrames' )
+federate.add_known_federates( [ ( True, str(federate.federate.name) ),
+                                ( True, 'JEODRefFrames' ) ] )
 
 #--------------------------------------------------------------------------
 # Configure the CRC.
 #--------------------------------------------------------------------------
 # Pitch specific local settings designator:
-THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
-#THLA.federate.local_settings = 'crcHost = 10.8.0.161\n crcPort = 8989'
+federate.set_CRC_settings( 'localhost', 8989 )
+#federate.set_CRC_settings( '10.8.0.161', 8989 )
 # Mak specific local settings designator, which is anything from the rid.mtl file:
 #THLA.federate.local_settings = '(setqb RTI_tcpForwarderAddr \'192.168.15.3\') (setqb RTI_distributedForwarderPort 5000)'
 
@@ -207,7 +211,7 @@ THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
 # Set up federate related time related parameters.
 #--------------------------------------------------------------------------
 # Pull the scenario timeline epoch from JEOD.
-federate.set_scenario_timeline_epoch( jeod_time.time_tt.trunc_julian_time * 86400.0 )
+federate.set_scenario_timeline_epoch( jeod_time.time_tt.trunc_julian_time * SECONDS_PER_DAY )
 
 # Must specify a federate HLA lookahead value in seconds.
 federate.set_lookahead_time( 0.250 )
@@ -229,7 +233,7 @@ federate.set_time_constrained( True )
 # By setting this we are specifying the use of Common Timing Equipment (CTE)
 # for controlling the Mode Transitions for all federates using CTE.
 # Don't really need CTE for RRFP.
-THLA.execution_control.cte_timeline = trick.sim_services.alloc_type( 1, 'TrickHLA::CTETimelineBase' )
+THLA.execution_control.cte_timeline = get_CTE_timeline()
 
 
 #---------------------------------------------------------------------------
@@ -252,18 +256,18 @@ mars_centered_fixed.frame_packing.debug     = verbose
 # Add the HLA SimObjects associated with this federate.
 # This is really only useful for turning on and off HLA objects.
 #---------------------------------------------------------------------------
-federate.add_sim_object( THLA )
-federate.add_sim_object( THLA_INIT )
-federate.add_sim_object( ref_frame_tree )
-federate.add_sim_object( solar_system_barycenter )
-federate.add_sim_object( sun_inertial )
-federate.add_sim_object( earth_moon_barycenter )
-federate.add_sim_object( earth_centered_inertial )
-federate.add_sim_object( moon_centered_inertial )
-federate.add_sim_object( mars_centered_inertial )
-federate.add_sim_object( earth_centered_fixed )
-federate.add_sim_object( moon_centered_fixed )
-federate.add_sim_object( mars_centered_fixed )
+federate.add_sim_objects( THLA,
+                          THLA_INIT,
+                          ref_frame_tree,
+                          solar_system_barycenter,
+                          sun_inertial,
+                          earth_moon_barycenter,
+                          earth_centered_inertial,
+                          moon_centered_inertial,
+                          mars_centered_inertial,
+                          earth_centered_fixed,
+                          moon_centered_fixed,
+                          mars_centered_fixed )
 
 
 #---------------------------------------------------------------------------
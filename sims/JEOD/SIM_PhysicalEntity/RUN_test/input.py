@@ -76,8 +76,11 @@ def parse_command_line( ) :
    # argv[0]=S_main*.exe, argv[1]=RUN/input.py file
    index = 2
    while (index < argc) :
+      
+      # Convert the argument to a string only once.
+      arg = str(argv[index])
          
-      if ((str(argv[index]) == '-a') | (str(argv[index]) == '--active')) :
+      if (arg in ('-a', '--active')) :
          index = index + 1
          if (index < argc) :
             active_entity_name = str(argv[index])
@@ -85,10 +88,10 @@ def parse_command_line( ) :
             print('ERROR: Missing --active [name] argument.')
             print_usage = True
             
-      elif ((str(argv[index]) == '-h') | (str(argv[index]) == '--help')) :
+      elif (arg in ('-h', '--help')) :
          print_usage = True
       
-      elif ((str(argv[index]) == '-f') | (str(argv[index]) == '--fed_name')) :
+      elif (arg in ('-f', '--fed_name')) :
          index = index + 1
          if (index < argc) :
             federate_name = str(argv[index])
@@ -96,7 +99,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fed_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-fe') | (str(argv[index]) == '--fex_name')) :
+      elif (arg in ('-fe', '--fex_name')) :
          index = index + 1
          if (index < argc) :
             federation_name = str(argv[index])
@@ -104,7 +107,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fex_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-m') | (str(argv[index]) == '--master')) :
+      elif (arg in ('-m', '--master')) :
          index = index + 1
          if (index < argc) :
             master_name = str(argv[index])
@@ -112,7 +115,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --master [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-p') | (str(argv[index]) == '--passive')) :
+      elif (arg in ('-p', '--passive')) :
          index = index + 1
          if (index < argc) :
             passive_entity_name = str(argv[index])
@@ -120,7 +123,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --passive [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-s') | (str(argv[index]) == '--stop')) :
+      elif (arg in ('-s', '--stop')) :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -128,29 +131,30 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '--nostop') :
+      elif (arg == '--nostop') :
          run_duration = None
       
-      elif (str(argv[index]) == '--verbose') :
+      elif (arg == '--verbose') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                verbose = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                verbose = False
             else :
-               print('ERROR: Unknown --verbose argument: ' + str(argv[index]))
+               print('ERROR: Unknown --verbose argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing --verbose [on|off] argument.')
             print_usage = True
       
-      elif (str(argv[index]) == '-d') :
+      elif (arg == '-d') :
          # Catch the Trick debug command line option an do NOT terminate.
          print('DEBUG: Specified input file debug uption to Trick.')
          
       else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
+         print('ERROR: Unknown command line argument ' + arg)
          print_usage = True
          
       index = index + 1
@@ -477,27 +481,27 @@ else :
 #--------------------------------------------------------------------------
 # Configure this federate SpaceFOM roles for this federate.
 #--------------------------------------------------------------------------
-federate.set_master_role( False ) # This is NOT the Master federate.
-federate.set_pacing_role( False ) # This is NOT the Pacing federate.
-federate.set_RRFP_role( False )   # This is NOT the Root Reference Frame Publisher.
+federate.setup_roles( master = False,  # This is NOT the Master federate.
+                      pacing = False,  # This is NOT the Pacing federate.
+                      RRFP   = False ) # This is NOT the Root Reference Frame Publisher.
 
 #--------------------------------------------------------------------------
 # Add in known required federates.
 #--------------------------------------------------------------------------
-federate.add_known_federate( True, str(federate.federate.name) )
-federate.add_known_federate( True, master_name )
+federate.add_known_federates( [ ( True, str(federate.federate.name) ),
+                                ( True, master_name ) ] )
 
 #--------------------------------------------------------------------------
 # Configure the CRC.
 #--------------------------------------------------------------------------
 # Pitch specific local settings designator:
-THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
+federate.set_CRC_settings( 'localhost', 8989 )
 
 #--------------------------------------------------------------------------
 # Set up federate related time related parameters.
 #--------------------------------------------------------------------------
 # Pull the scenario timeline epoch from JEOD.
-federate.set_scenario_timeline_epoch( jeod_time.time_tt.trunc_julian_time * 86400.0 )
+federate.set_scenario_timeline_epoch( jeod_time.time_tt.trunc_julian_time * SECONDS_PER_DAY )
 
 # Must specify a federate HLA lookahead value in seconds.
 federate.set_lookahead_time( 0.250 )
@@ -519,7 +523,7 @@ federate.set_time_constrained( True )
 # By setting this we are specifying the use of Common Timing Equipment (CTE)
 # for controlling the Mode Transitions for all federates using CTE.
 # Don't really need CTE for RRFP.
-THLA.execution_control.cte_timeline = trick.sim_services.alloc_type( 1, 'TrickHLA::CTETimelineBase' )
+THLA.execution_control.cte_timeline = get_CTE_timeline()
 
 
 #---------------------------------------------------------------------------
@@ -628,22 +632,22 @@ passive_physical_interface.interface_packing.set_parent( passive_entity_name )
 # Add the HLA SimObjects associated with this federate.
 # This is really only useful for turning on and off HLA objects.
 #---------------------------------------------------------------------------
-federate.add_sim_object( THLA )
-federate.add_sim_object( THLA_INIT )
-federate.add_sim_object( ref_frame_tree )
-federate.add_sim_object( solar_system_barycenter )
-federate.add_sim_object( sun_inertial )
-federate.add_sim_object( earth_moon_barycenter )
-federate.add_sim_object( earth_centered_inertial )
-federate.add_sim_object( moon_centered_inertial )
-federate.add_sim_object( mars_centered_inertial )
-federate.add_sim_object( earth_centered_fixed )
-federate.add_sim_object( moon_centered_fixed )
-federate.add_sim_object( mars_centered_fixed )
-federate.add_sim_object( active_physical_entity )
-federate.add_sim_object( active_physical_interface )
-federate.add_sim_object( passive_physical_entity )
-federate.add_sim_object( passive_physical_interface )
+federate.add_sim_objects( THLA,
+                          THLA_INIT,
+                          ref_frame_tree,
+                          solar_system_barycenter,
+                          sun_inertial,
+                          earth_moon_barycenter,
+                          earth_centered_inertial,
+                          moon_centered_inertial,
+                          mars_centered_inertial,
+                          earth_centered_fixed,
+                          moon_centered_fixed,
+                          mars_centered_fixed,
+                          active_physical_entity,
+                          active_physical_interface,
+                          passive_physical_entity,
+                          passive_physical_interface )
 
 
 #---------------------------------------------------------------------------
@@ -73,7 +73,10 @@ def parse_command_line( ) :
    index = 2
    while (index < argc) :
       
-      if (str(argv[index]) == '--stop') :
+      # Convert the argument to a string only once.
+      arg = str(argv[index])
+      
+      if (arg == '--stop') :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -81,13 +84,13 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '--nostop') :
+      elif (arg == '--nostop') :
          run_duration = None
          
-      elif ((str(argv[index]) == '-h') | (str(argv[index]) == '--help')) :
+      elif (arg in ('-h', '--help')) :
          print_usage = True
       
-      elif ((str(argv[index]) == '-de')) :
+      elif (arg == '-de') :
          index = index + 1
          if (index < argc) :
             dyn_entity_name = str(argv[index])
@@ -95,7 +98,7 @@ def parse_command_line( ) :
             print('ERROR: Missing -de [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '--dyn_fed')) :
+      elif (arg == '--dyn_fed') :
          index = index + 1
          if (index < argc) :
             dyn_federate_name = str(argv[index])
@@ -103,7 +106,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --dyn_fed [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-f') | (str(argv[index]) == '--fed_name')) :
+      elif (arg in ('-f', '--fed_name')) :
          index = index + 1
          if (index < argc) :
             federate_name = str(argv[index])
@@ -111,7 +114,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fed_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-fe') | (str(argv[index]) == '--fex_name')) :
+      elif (arg in ('-fe', '--fex_name')) :
          index = index + 1
          if (index < argc) :
             federation_name = str(argv[index])
@@ -119,7 +122,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fex_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-pe')) :
+      elif (arg == '-pe') :
          index = index + 1
          if (index < argc) :
             phy_entity_name = str(argv[index])
@@ -127,7 +130,7 @@ def parse_command_line( ) :
             print('ERROR: Missing -pe [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-pi')) :
+      elif (arg == '-pi') :
          index = index + 1
          if (index < argc) :
             phy_interface_name = str(argv[index])
@@ -135,26 +138,27 @@ def parse_command_line( ) :
             print('ERROR: Missing -pi [name] argument.')
             print_usage = True
       
-      elif (str(argv[index]) == '--verbose') :
+      elif (arg == '--verbose') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                verbose = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                verbose = False
             else :
-               print('ERROR: Unknown --verbose argument: ' + str(argv[index]))
+               print('ERROR: Unknown --verbose argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing --verbose [on|off] argument.')
             print_usage = True
          
-      elif ((str(argv[index]) == '-d')) :
+      elif (arg == '-d') :
          # Pass this on to Trick.
          break
          
       else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
+         print('ERROR: Unknown command line argument ' + arg)
          print_usage = True
          
       index = index + 1
@@ -326,27 +330,27 @@ else :
 #--------------------------------------------------------------------------
 # Configure this federate SpaceFOM roles for this federate.
 #--------------------------------------------------------------------------
-federate.set_master_role( False ) # This is NOT the Master federate.
-federate.set_pacing_role( False ) # This is NOT the Pacing federate.
-federate.set_RRFP_role( False )   # This is NOT the Root Reference Frame Publisher.
+federate.setup_roles( master = False,  # This is NOT the Master federate.
+                      pacing = False,  # This is NOT the Pacing federate.
+                      RRFP   = False ) # This is NOT the Root Reference Frame Publisher.
 
 #--------------------------------------------------------------------------
 # Add in known required federates.
 #--------------------------------------------------------------------------
 # This is the PhysicalEntity test federate.
 # It doesn't really need to know about any other federates.
-federate.add_known_federate( True, str(federate.federate.name) )
-federate.add_known_federate( True, 'MPR' )
-federate.add_known_federate( True, dyn_federate_name )
+federate.add_known_federates( [ ( True, str(federate.federate.name) ),
+                                ( True, 'MPR' ),
+                                ( True, dyn_federate_name ) ] )
 
 #--------------------------------------------------------------------------
 # Configure the CRC.
 #--------------------------------------------------------------------------
 # Pitch specific local settings designator:
-THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
-#THLA.federate.local_settings = 'crcHost = js-er7-rti-dev.jsc.nasa.gov\n crcPort = 8989
-#THLA.federate.local_settings = 'crcHost = mobius.jsc.nasa.gov\n crcPort = 8989'
-#THLA.federate.local_settings = 'crcHost = 10.8.0.161\n crcPort = 8989'
+federate.set_CRC_settings( 'localhost', 8989 )
+#federate.set_CRC_settings( 'js-er7-rti-dev.jsc.nasa.gov', 8989 )
+#federate.set_CRC_settings( 'mobius.jsc.nasa.gov', 8989 )
+#federate.set_CRC_settings( '10.8.0.161', 8989 )
 # Mak specific local settings designator, which is anything from the rid.mtl file:
 #THLA.federate.local_settings = '(setqb RTI_tcpForwarderAddr \'192.168.15.3\') (setqb RTI_distributedForwarderPort 5000)'
 
@@ -369,7 +373,7 @@ federate.set_time_constrained( True )
 # By setting this we are specifying the use of Common Timing Equipment (CTE)
 # for controlling the Mode Transitions for all federates using CTE.
 # Don't really need CTE for RRFP.
-#THLA.execution_control.cte_timeline = trick.sim_services.alloc_type( 1, 'TrickHLA::CTETimelineBase' )
+#THLA.execution_control.cte_timeline = get_CTE_timeline()
 
 
 
@@ -505,12 +509,12 @@ dyn_entity.set_lag_comp_type( trick.TrickHLA.LAG_COMPENSATION_RECEIVE_SIDE )
 # This is really only useful for turning on and off HLA objects.
 # This doesn't really apply to these example simulations which are only HLA.
 #---------------------------------------------------------------------------
-federate.add_sim_object( THLA )
-federate.add_sim_object( THLA_INIT )
-federate.add_sim_object( root_ref_frame )
-federate.add_sim_object( ref_frame_A )
-federate.add_sim_object( physical_entity )
-federate.add_sim_object( dynamical_entity )
+federate.add_sim_objects( THLA,
+                          THLA_INIT,
+                          root_ref_frame,
+                          ref_frame_A,
+                          physical_entity,
+                          dynamical_entity )
 
 
 #---------------------------------------------------------------------------
@@ -64,10 +64,13 @@ def parse_command_line( ) :
    index = 2
    while (index < argc) :
       
-      if ((str(argv[index]) == '-h') | (str(argv[index]) == '--help')) :
+      # Convert the argument to a string only once.
+      arg = str(argv[index])
+      
+      if (arg in ('-h', '--help')) :
          print_usage = True
       
-      elif ((str(argv[index]) == '-f') | (str(argv[index]) == '--fed_name')) :
+      elif (arg in ('-f', '--fed_name')) :
          index = index + 1
          if (index < argc) :
             federate_name = str(argv[index])
@@ -75,7 +78,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fed_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-fe') | (str(argv[index]) == '--fex_name')) :
+      elif (arg in ('-fe', '--fex_name')) :
          index = index + 1
          if (index < argc) :
             federation_name = str(argv[index])
@@ -83,7 +86,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fex_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-p') | (str(argv[index]) == '--pacing')) :
+      elif (arg in ('-p', '--pacing')) :
          index = index + 1
          if (index < argc) :
             pacing_name = str(argv[index])
@@ -91,7 +94,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --pacing [name] argument.')
             print_usage = True 
       
-      elif ((str(argv[index]) == '-r') | (str(argv[index]) == '--rrfp')) :
+      elif (arg in ('-r', '--rrfp')) :
          index = index + 1
          if (index < argc) :
             rrfp_name = str(argv[index])
@@ -99,10 +102,10 @@ def parse_command_line( ) :
             print('ERROR: Missing --rrfp [name] argument.')
             print_usage = True 
             
-      elif (str(argv[index]) == '-nostop') :
+      elif (arg == '-nostop') :
          run_duration = None
       
-      elif ((str(argv[index]) == '-s') | (str(argv[index]) == '--stop')) :
+      elif (arg in ('-s', '--stop')) :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -110,21 +113,22 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
       
-      elif (str(argv[index]) == '--verbose') :
+      elif (arg == '--verbose') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                verbose = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                verbose = False
             else :
-               print('ERROR: Unknown --verbose argument: ' + str(argv[index]))
+               print('ERROR: Unknown --verbose argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing --verbose [on|off] argument.')
             print_usage = True
          
-      elif ((str(argv[index]) == '-d')) :
+      elif (arg == '-d') :
          # Pass this on to Trick.
          break
          
@@ -204,29 +208,29 @@ else :
 #--------------------------------------------------------------------------
 # Configure this federate SpaceFOM roles for this federate.
 #--------------------------------------------------------------------------
-federate.set_master_role( True )  # This is the Master federate.
-federate.set_pacing_role( False ) # This is NOT the Pacing federate.
-federate.set_RRFP_role( False )   # This is NOT the Root Reference Frame Publisher.
+federate.setup_roles( master = True,   # This is the Master federate.
+                      pacing = False,  # This is NOT the Pacing federate.
+                      RRFP   = False ) # This is NOT the Root Reference Frame Publisher.
 
 #--------------------------------------------------------------------------
 # Add in known required federates.
 #--------------------------------------------------------------------------
-federate.add_known_federate( True, str(federate.federate.name) )
-federate.add_known_federate( True, pacing_name )
-federate.add_known_federate( True, rrfp_name )
+federate.add_known_federates( [ ( True, str(federate.federate.name) ),
+                                ( True, pacing_name ),
+                                ( True, rrfp_name ) ] )
 
 #--------------------------------------------------------------------------
 # Configure the CRC.
 #--------------------------------------------------------------------------
 # Pitch specific local settings designator:
-THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
-#THLA.federate.local_settings = 'crcHost = js-er7-rti-dev.jsc.nasa.gov\n crcPort = 8989'
+federate.set_CRC_settings( 'localhost', 8989 )
+#federate.set_CRC_settings( 'js-er7-rti-dev.jsc.nasa.gov', 8989 )
 
 #--------------------------------------------------------------------------
 # Set up federate related time related parameters.
 #--------------------------------------------------------------------------
 # Compute TT for 04 Jan 2019 12:00 PM. = 18487.75(days) + 37.0(s) + 32.184(s)
-federate.set_scenario_timeline_epoch( float((18487.75*24.0*60.0*60.0) + 37.0 + 32.184) )
+federate.set_scenario_timeline_epoch( SCENARIO_EPOCH_TT_04JAN2019 )
 
 # Specify the HLA base time units (default: trick.HLA_BASE_TIME_MICROSECONDS).
 federate.set_HLA_base_time_units( trick.HLA_BASE_TIME_MICROSECONDS )
@@ -257,7 +261,7 @@ federate.set_time_constrained( True )
 # By setting this we are specifying the use of Common Timing Equipment (CTE)
 # for controlling the Mode Transitions for all federates using CTE.
 # Don't really need CTE for RRFP.
-THLA.execution_control.cte_timeline = trick.sim_services.alloc_type( 1, 'TrickHLA::CTETimelineBase' )
+THLA.execution_control.cte_timeline = get_CTE_timeline()
 
 
 #---------------------------------------------------------------------------
@@ -315,10 +319,10 @@ frame_A.set_lag_comp_type( trick.TrickHLA.LAG_COMPENSATION_NONE )
 # This is really only useful for turning on and off HLA objects.
 # This doesn't really apply to these example simulations which are only HLA.
 #---------------------------------------------------------------------------
-federate.add_sim_object( THLA )
-federate.add_sim_object( THLA_INIT )
-federate.add_sim_object( root_ref_frame )
-federate.add_sim_object( ref_frame_A )
+federate.add_sim_objects( THLA,
+                          THLA_INIT,
+                          root_ref_frame,
+                          ref_frame_A )
 
 
 #---------------------------------------------------------------------------
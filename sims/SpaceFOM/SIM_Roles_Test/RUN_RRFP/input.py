@@ -63,10 +63,13 @@ def parse_command_line( ) :
    index = 2
    while (index < argc) :
       
-      if ((str(argv[index]) == '-h') | (str(argv[index]) == '--help')) :
+      # Convert the argument to a string only once.
+      arg = str(argv[index])
+      
+      if (arg in ('-h', '--help')) :
          print_usage = True
       
-      elif ((str(argv[index]) == '-f') | (str(argv[index]) == '--fed_name')) :
+      elif (arg in ('-f', '--fed_name')) :
          index = index + 1
          if (index < argc) :
             federate_name = str(argv[index])
@@ -74,7 +77,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fed_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-fe') | (str(argv[index]) == '--fex_name')) :
+      elif (arg in ('-fe', '--fex_name')) :
          index = index + 1
          if (index < argc) :
             federation_name = str(argv[index])
@@ -82,7 +85,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fex_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-m') | (str(argv[index]) == '--master')) :
+      elif (arg in ('-m', '--master')) :
          index = index + 1
          if (index < argc) :
             master_name = str(argv[index])
@@ -90,7 +93,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --master [name] argument.')
             print_usage = True 
       
-      elif ((str(argv[index]) == '-p') | (str(argv[index]) == '--pacing')) :
+      elif (arg in ('-p', '--pacing')) :
          index = index + 1
          if (index < argc) :
             pacing_name = str(argv[index])
@@ -98,10 +101,10 @@ def parse_command_line( ) :
             print('ERROR: Missing --pacing [name] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-nostop') :
+      elif (arg == '-nostop') :
          run_duration = None
       
-      elif ((str(argv[index]) == '-r') | (str(argv[index]) == '--root_frame')) :
+      elif (arg in ('-r', '--root_frame')) :
          index = index + 1
          if (index < argc) :
             root_frame_name = str(argv[index])
@@ -109,7 +112,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --root_frame [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-s') | (str(argv[index]) == '--stop')) :
+      elif (arg in ('-s', '--stop')) :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -117,26 +120,27 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
       
-      elif (str(argv[index]) == '--verbose') :
+      elif (arg == '--verbose') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                verbose = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                verbose = False
             else :
-               print('ERROR: Unknown --verbose argument: ' + str(argv[index]))
+               print('ERROR: Unknown --verbose argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing --verbose [on|off] argument.')
             print_usage = True
          
-      elif ((str(argv[index]) == '-d')) :
+      elif (arg == '-d') :
          # Pass this on to Trick.
          break
          
       else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
+         print('ERROR: Unknown command line argument ' + arg)
          print_usage = True
          
       index = index + 1
@@ -216,9 +220,9 @@ else :
 #--------------------------------------------------------------------------
 # Configure this federate SpaceFOM roles for this federate.
 #--------------------------------------------------------------------------
-federate.set_master_role( False ) # This is NOT the Master federate.
-federate.set_pacing_role( False ) # This is NOT the Pacing federate.
-federate.set_RRFP_role( True )    # This is the Root Reference Frame Publisher.
+federate.setup_roles( master = False, # This is NOT the Master federate.
+                      pacing = False, # This is NOT the Pacing federate.
+                      RRFP   = True ) # This is the Root Reference Frame Publisher.
 
 #--------------------------------------------------------------------------
 # Add in known required federates.
@@ -233,8 +237,8 @@ federate.set_RRFP_role( True )    # This is the Root Reference Frame Publisher.
 # Configure the CRC.
 #--------------------------------------------------------------------------
 # Pitch specific local settings designator:
-THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
-#THLA.federate.local_settings = 'crcHost = js-er7-rti-dev.jsc.nasa.gov\n crcPort = 8989'
+federate.set_CRC_settings( 'localhost', 8989 )
+#federate.set_CRC_settings( 'js-er7-rti-dev.jsc.nasa.gov', 8989 )
 
 #--------------------------------------------------------------------------
 # Set up federate related time related parameters.
@@ -261,7 +265,7 @@ federate.set_time_constrained( True )
 # By setting this we are specifying the use of Common Timing Equipment (CTE)
 # for controlling the Mode Transitions for all federates using CTE.
 # Don't really need CTE for RRFP.
-#THLA.execution_control.cte_timeline = trick.sim_services.alloc_type( 1, 'TrickHLA::CTETimelineBase' )
+#THLA.execution_control.cte_timeline = get_CTE_timeline()
 
 
 #---------------------------------------------------------------------------
@@ -270,38 +274,22 @@ federate.set_time_constrained( True )
 ref_frame_tree.root_frame_data.name = root_frame_name
 ref_frame_tree.root_frame_data.parent_name = ''
                                         
-ref_frame_tree.root_frame_data.state.pos[0] = 0.0
-ref_frame_tree.root_frame_data.state.pos[1] = 0.0
-ref_frame_tree.root_frame_data.state.pos[2] = 0.0
-ref_frame_tree.root_frame_data.state.vel[0] = 0.0
-ref_frame_tree.root_frame_data.state.vel[1] = 0.0
-ref_frame_tree.root_frame_data.state.vel[2] = 0.0
+ref_frame_tree.root_frame_data.state.pos = [ 0.0, 0.0, 0.0 ]
+ref_frame_tree.root_frame_data.state.vel = [ 0.0, 0.0, 0.0 ]
 ref_frame_tree.root_frame_data.state.att.scalar  = 1.0
-ref_frame_tree.root_frame_data.state.att.vector[0] = 0.0
-ref_frame_tree.root_frame_data.state.att.vector[1] = 0.0
-ref_frame_tree.root_frame_data.state.att.vector[2] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[0] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[1] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[2] = 0.0
+ref_frame_tree.root_frame_data.state.att.vector = [ 0.0, 0.0, 0.0 ]
+ref_frame_tree.root_frame_data.state.ang_vel = [ 0.0, 0.0, 0.0 ]
 ref_frame_tree.root_frame_data.state.time = 0.0
 
 
 ref_frame_tree.vehicle_frame_data.name = 'FrameA'
 ref_frame_tree.vehicle_frame_data.parent_name = root_frame_name
                                         
-ref_frame_tree.vehicle_frame_data.state.pos[0] = 10.0
-ref_frame_tree.vehicle_frame_data.state.pos[1] = 10.0
-ref_frame_tree.vehicle_frame_data.state.pos[2] = 10.0
-ref_frame_tree.vehicle_frame_data.state.vel[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.vel[1] = 0.1
-ref_frame_tree.vehicle_frame_data.state.vel[2] = 0.0
+ref_frame_tree.vehicle_frame_data.state.pos = [ 10.0, 10.0, 10.0 ]
+ref_frame_tree.vehicle_frame_data.state.vel = [ 0.0, 0.1, 0.0 ]
 ref_frame_tree.vehicle_frame_data.state.att.scalar  = 1.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[1] = 0.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[2] = 0.0
-ref_frame_tree.vehicle_frame_data.state.ang_vel[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.ang_vel[1] = 0.1
-ref_frame_tree.vehicle_frame_data.state.ang_vel[2] = 0.0
+ref_frame_tree.vehicle_frame_data.state.att.vector = [ 0.0, 0.0, 0.0 ]
+ref_frame_tree.vehicle_frame_data.state.ang_vel = [ 0.0, 0.1, 0.0 ]
 ref_frame_tree.vehicle_frame_data.state.time = 0.0
 
 
@@ -354,10 +342,10 @@ frame_A.set_lag_comp_type( trick.TrickHLA.LAG_COMPENSATION_RECEIVE_SIDE )
 # This is really only useful for turning on and off HLA objects.
 # This doesn't really apply to these example simulations which are only HLA.
 #---------------------------------------------------------------------------
-federate.add_sim_object( THLA )
-federate.add_sim_object( THLA_INIT )
-federate.add_sim_object( root_ref_frame )
-federate.add_sim_object( ref_frame_A )
+federate.add_sim_objects( THLA,
+                          THLA_INIT,
+                          root_ref_frame,
+                          ref_frame_A )
 
 
 #---------------------------------------------------------------------------
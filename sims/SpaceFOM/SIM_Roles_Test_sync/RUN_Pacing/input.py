@@ -66,63 +66,70 @@ def parse_command_line( ) :
    index = 2
    while (index < argc) :
       
-      if (str(argv[index]) == '-realtime') :
+      # Convert the argument to a string only once.
+      arg = str(argv[index])
+      
+      if (arg == '-realtime') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                realtime_clock = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                realtime_clock = False
             else :
-               print('ERROR: Unknown -realtime argument: ' + str(argv[index]))
+               print('ERROR: Unknown -realtime argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -realtime [on|off] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-hla-time-mgt') :
+      elif (arg == '-hla-time-mgt') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                hla_time_mgt = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                hla_time_mgt = False
             else :
-               print('ERROR: Unknown -hla-time-mgt argument: ' + str(argv[index]))
+               print('ERROR: Unknown -hla-time-mgt argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -hla-time-mgt [on|off] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-regulating') :
+      elif (arg == '-regulating') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                time_regulating = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                time_regulating = False
             else :
-               print('ERROR: Unknown -regulating argument: ' + str(argv[index]))
+               print('ERROR: Unknown -regulating argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -regulating [on|off] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-constrained') :
+      elif (arg == '-constrained') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                time_constrained = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                time_constrained = False
             else :
-               print('ERROR: Unknown -constrained argument: ' + str(argv[index]))
+               print('ERROR: Unknown -constrained argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -constrained [on|off] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-stop') :
+      elif (arg == '-stop') :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -130,28 +137,29 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-nostop') :
+      elif (arg == '-nostop') :
          run_duration = None
          
-      elif ((str(argv[index]) == '-h') | (str(argv[index]) == '-help')) :
+      elif (arg in ('-h', '-help')) :
          print_usage = True
          
-      elif (str(argv[index]) == '-verbose') :
+      elif (arg == '-verbose') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                verbose = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                verbose = False
             else :
-               print('ERROR: Unknown -verbose argument: ' + str(argv[index]))
+               print('ERROR: Unknown -verbose argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -verbose [on|off] argument.')
             print_usage = True
          
       else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
+         print('ERROR: Unknown command line argument ' + arg)
          print_usage = True
          
       index = index + 1
@@ -236,9 +244,9 @@ else :
 #--------------------------------------------------------------------------
 # Configure this federate SpaceFOM roles for this federate.
 #--------------------------------------------------------------------------
-federate.set_master_role( False ) # This is NOT the Master federate.
-federate.set_pacing_role( True )  # This is the Pacing federate.
-federate.set_RRFP_role( False )   # This is NOT the Root Reference Frame Publisher.
+federate.setup_roles( master = False,  # This is NOT the Master federate.
+                      pacing = True,   # This is the Pacing federate.
+                      RRFP   = False ) # This is NOT the Root Reference Frame Publisher.
 
 #--------------------------------------------------------------------------
 # Add in known required federates.
@@ -253,8 +261,8 @@ federate.set_RRFP_role( False )   # This is NOT the Root Reference Frame Publish
 # Configure the CRC.
 #--------------------------------------------------------------------------
 # Pitch specific local settings designator:
-THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
-#THLA.federate.local_settings = 'crcHost = 10.8.0.161\n crcPort = 8989'
+federate.set_CRC_settings( 'localhost', 8989 )
+#federate.set_CRC_settings( '10.8.0.161', 8989 )
 # Mak specific local settings designator, which is anything from the rid.mtl file:
 #THLA.federate.local_settings = '(setqb RTI_tcpForwarderAddr \'192.168.15.3\') (setqb RTI_distributedForwarderPort 5000)'
 
@@ -303,7 +311,7 @@ else :
 # By setting this we are specifying the use of Common Timing Equipment (CTE)
 # for controlling the Mode Transitions for all federates using CTE.
 # Don't really need CTE for RRFP.
-THLA.execution_control.cte_timeline = trick.sim_services.alloc_type( 1, 'TrickHLA::CTETimelineBase' )
+THLA.execution_control.cte_timeline = get_CTE_timeline()
 
 
 #------------------------------------------------------------------------------
@@ -319,8 +327,8 @@ trick.exec_set_sim_object_onoff( 'ref_frame_A' , False )
 # This is really only useful for turning on and off HLA objects.
 # This doesn't really apply to these example simulations which are only HLA.
 #---------------------------------------------------------------------------
-federate.add_sim_object( THLA )
-federate.add_sim_object( THLA_INIT )
+federate.add_sim_objects( THLA,
+                          THLA_INIT )
 
 
 #---------------------------------------------------------------------------
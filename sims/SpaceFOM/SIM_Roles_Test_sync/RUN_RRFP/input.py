@@ -66,63 +66,70 @@ def parse_command_line( ) :
    index = 2
    while (index < argc) :
       
-      if (str(argv[index]) == '-realtime') :
+      # Convert the argument to a string only once.
+      arg = str(argv[index])
+      
+      if (arg == '-realtime') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                realtime_clock = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                realtime_clock = False
             else :
-               print('ERROR: Unknown -realtime argument: ' + str(argv[index]))
+               print('ERROR: Unknown -realtime argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -realtime [on|off] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-hla-time-mgt') :
+      elif (arg == '-hla-time-mgt') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                hla_time_mgt = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                hla_time_mgt = False
             else :
-               print('ERROR: Unknown -hla-time-mgt argument: ' + str(argv[index]))
+               print('ERROR: Unknown -hla-time-mgt argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -hla-time-mgt [on|off] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-regulating') :
+      elif (arg == '-regulating') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                time_regulating = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                time_regulating = False
             else :
-               print('ERROR: Unknown -regulating argument: ' + str(argv[index]))
+               print('ERROR: Unknown -regulating argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -regulating [on|off] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-constrained') :
+      elif (arg == '-constrained') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                time_constrained = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                time_constrained = False
             else :
-               print('ERROR: Unknown -constrained argument: ' + str(argv[index]))
+               print('ERROR: Unknown -constrained argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -constrained [on|off] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-stop') :
+      elif (arg == '-stop') :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -130,32 +137,33 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-nostop') :
+      elif (arg == '-nostop') :
          run_duration = None
          
-      elif ((str(argv[index]) == '-h') | (str(argv[index]) == '-help')) :
+      elif (arg in ('-h', '-help')) :
          print_usage = True
          
-      elif (str(argv[index]) == '-verbose') :
+      elif (arg == '-verbose') :
          index = index + 1
          if (index < argc) :
-            if (str(argv[index]) == 'on') :
+            value = str(argv[index])
+            if (value == 'on') :
                verbose = True
-            elif (str(argv[index]) == 'off') :
+            elif (value == 'off') :
                verbose = False
             else :
-               print('ERROR: Unknown -verbose argument: ' + str(argv[index]))
+               print('ERROR: Unknown -verbose argument: ' + value)
                print_usage = True
          else :
             print('ERROR: Missing -verbose [on|off] argument.')
             print_usage = True
          
-      elif ((str(argv[index]) == '-d')) :
+      elif (arg == '-d') :
          # Pass this on to Trick.
          break
             
       else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
+         print('ERROR: Unknown command line argument ' + arg)
          print_usage = True
          
       index = index + 1
@@ -240,9 +248,9 @@ else :
 #--------------------------------------------------------------------------
 # Configure this federate SpaceFOM roles for this federate.
 #--------------------------------------------------------------------------
-federate.set_master_role( False ) # This is NOT the Master federate.
-federate.set_pacing_role( False ) # This is NOT the Pacing federate.
-federate.set_RRFP_role( True )    # This is the Root Reference Frame Publisher.
+federate.setup_roles( master = False, # This is NOT the Master federate.
+                      pacing = False, # This is NOT the Pacing federate.
+                      RRFP   = True ) # This is the Root Reference Frame Publisher.
 
 #--------------------------------------------------------------------------
 # Add in known required federates.
@@ -257,8 +265,8 @@ federate.set_RRFP_role( True )    # This is the Root Reference Frame Publisher.
 # Configure the CRC.
 #--------------------------------------------------------------------------
 # Pitch specific local settings designator:
-THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
-#THLA.federate.local_settings = 'crcHost = 10.8.0.161\n crcPort = 8989'
+federate.set_CRC_settings( 'localhost', 8989 )
+#federate.set_CRC_settings( '10.8.0.161', 8989 )
 # Mak specific local settings designator, which is anything from the rid.mtl file:
 #THLA.federate.local_settings = '(setqb RTI_tcpForwarderAddr \'192.168.15.3\') (setqb RTI_distributedForwarderPort 5000)'
 
@@ -307,7 +315,7 @@ else :
 # By setting this we are specifying the use of Common Timing Equipment (CTE)
 # for controlling the Mode Transitions for all federates using CTE.
 # Don't really need CTE for RRFP.
-#THLA.execution_control.cte_timeline = trick.sim_services.alloc_type( 1, 'TrickHLA::CTETimelineBase' )
+#THLA.execution_control.cte_timeline = get_CTE_timeline()
 
 
 #---------------------------------------------------------------------------
@@ -319,38 +327,22 @@ parent_frame_name = ''
 ref_frame_tree.root_frame_data.name = root_frame_name
 ref_frame_tree.root_frame_data.parent_name = parent_frame_name
                                         
-ref_frame_tree.root_frame_data.state.pos[0] = 0.0
-ref_frame_tree.root_frame_data.state.pos[1] = 0.0
-ref_frame_tree.root_frame_data.state.pos[2] = 0.0
-ref_frame_tree.root_frame_data.state.vel[0] = 0.0
-ref_frame_tree.root_frame_data.state.vel[1] = 0.0
-ref_frame_tree.root_frame_data.state.vel[2] = 0.0
+ref_frame_tree.root_frame_data.state.pos = [ 0.0, 0.0, 0.0 ]
+ref_frame_tree.root_frame_data.state.vel = [ 0.0, 0.0, 0.0 ]
 ref_frame_tree.root_frame_data.state.att.scalar  = 1.0
-ref_frame_tree.root_frame_data.state.att.vector[0] = 0.0
-ref_frame_tree.root_frame_data.state.att.vector[1] = 0.0
-ref_frame_tree.root_frame_data.state.att.vector[2] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[0] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[1] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[2] = 0.0
+ref_frame_tree.root_frame_data.state.att.vector = [ 0.0, 0.0, 0.0 ]
+ref_frame_tree.root_frame_data.state.ang_vel = [ 0.0, 0.0, 0.0 ]
 ref_frame_tree.root_frame_data.state.time = 0.0
 
 
 ref_frame_tree.vehicle_frame_data.name = 'FrameA'
 ref_frame_tree.vehicle_frame_data.parent_name = root_frame_name
                                         
-ref_frame_tree.vehicle_frame_data.state.pos[0] = 10.0
-ref_frame_tree.vehicle_frame_data.state.pos[1] = 10.0
-ref_frame_tree.vehicle_frame_data.state.pos[2] = 10.0
-ref_frame_tree.vehicle_frame_data.state.vel[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.vel[1] = 0.1
-ref_frame_tree.vehicle_frame_data.state.vel[2] = 0.0
+ref_frame_tree.vehicle_frame_data.state.pos = [ 10.0, 10.0, 10.0 ]
+ref_frame_tree.vehicle_frame_data.state.vel = [ 0.0, 0.1, 0.0 ]
 ref_frame_tree.vehicle_frame_data.state.att.scalar  = 1.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[1] = 0.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[2] = 0.0
-ref_frame_tree.vehicle_frame_data.state.ang_vel[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.ang_vel[1] = 0.1
-ref_frame_tree.vehicle_frame_data.state.ang_vel[2] = 0.0
+ref_frame_tree.vehicle_frame_data.state.att.vector = [ 0.0, 0.0, 0.0 ]
+ref_frame_tree.vehicle_frame_data.state.ang_vel = [ 0.0, 0.1, 0.0 ]
 ref_frame_tree.vehicle_frame_data.state.time = 0.0
 
 
@@ -405,10 +397,10 @@ frame_A.set_lag_comp_type( trick.TrickHLA.LAG_COMPENSATION_NONE )
 # This is really only useful for turning on and off HLA objects.
 # This doesn't really apply to these example simulations which are only HLA.
 #---------------------------------------------------------------------------
-federate.add_sim_object( THLA )
-federate.add_sim_object( THLA_INIT )
-federate.add_sim_object( root_ref_frame )
-federate.add_sim_object( ref_frame_A )
+federate.add_sim_objects( THLA,
+                          THLA_INIT,
+                          root_ref_frame,
+                          ref_frame_A )
 
 
 #---------------------------------------------------------------------------
@@ -13,31 +13,24 @@
 #    (((Dan Dexter) (NASA) (May 2013) (--) (Initial implementation.)))
 ##############################################################################
 
-# Analytic sine data
-A.sim_data.value = 0.0
-A.sim_data.dvdt  = 0.392699
-A.sim_data.amp   = 2.0
-A.sim_data.phase = 0.0
-A.sim_data.freq  = 0.1963495
+def init_sine_state( sine, amp, freq ) :
 
-# Analytic sine truth state
-A.truth_data.value = 0.0
-A.truth_data.dvdt  = 0.392699
-A.truth_data.amp   = 2.0
-A.truth_data.phase = 0.0
-A.truth_data.freq  = 0.1963495
+   # Sine data at time zero, where the derivative of amp * sin( freq * t )
+   # is just amp * freq.
+   sine.sim_data.value = 0.0
+   sine.sim_data.dvdt  = amp * freq
+   sine.sim_data.amp   = amp
+   sine.sim_data.phase = 0.0
+   sine.sim_data.freq  = freq
 
+   # The sine truth state starts out the same as the sine data, so copy it
+   # in one call instead of setting each field again.
+   sine.truth_data.copy_data( sine.sim_data )
+   return
 
-# Propagated sine data
-P.sim_data.value = 0.0
-P.sim_data.dvdt  = 0.392699
-P.sim_data.amp   = 1.0
-P.sim_data.phase = 0.0
-P.sim_data.freq  = 0.392699
 
-# Propagated sine truth state
-P.truth_data.value = 0.0
-P.truth_data.dvdt  = 0.392699
-P.truth_data.amp   = 1.0
-P.truth_data.phase = 0.0
-P.truth_data.freq  = 0.392699
+# Analytic sine data and truth state
+init_sine_state( A, 2.0, 0.1963495 )
+
+# Propagated sine data and truth state
+init_sine_state( P, 1.0, 0.392699 )
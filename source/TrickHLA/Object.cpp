@@ -4158,14 +4158,12 @@ Attribute *Object::get_attribute(
 Attribute *Object::get_attribute(
    string const &attr_FOM_name )
 {
-   string fom_name_str;
    for ( unsigned int i = 0; i < attr_count; ++i ) {
-      if ( attributes[i].get_FOM_name() != NULL ) {
-         fom_name_str = attributes[i].get_FOM_name();
-
-         if ( attr_FOM_name == fom_name_str ) {
-            return ( &attributes[i] );
-         }
+      // Compare directly against the C string to avoid copying every
+      // attribute FOM name into a temporary std::string.
+      char const *fom_name = attributes[i].get_FOM_name();
+      if ( ( fom_name != NULL ) && ( attr_FOM_name == fom_name ) ) {
+         return ( &attributes[i] );
       }
    }
    return NULL;